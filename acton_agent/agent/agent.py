@@ -5,8 +5,11 @@ This module contains the core Agent class that orchestrates LLM interactions,
 tool execution, and conversation management.
 """
 
+import json
+import os
 import uuid
 from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
@@ -83,6 +86,9 @@ class Agent:
         timezone: str = "UTC",
         memory: AgentMemory | None = None,
         verbose: bool = False,
+        parallel_tool_calls: bool = False,
+        max_tool_workers: int | None = None,
+        cache_tool_results: bool = False,
     ):
         """
         Create a new Agent configured to coordinate LLM calls, tool execution, retries, and conversation memory.
@@ -97,7 +103,16 @@ class Agent:
             timezone: Timezone name used when inserting the current date/time into system messages (e.g., "UTC", "America/New_York"); defaults to "UTC".
             memory: Optional memory manager; when None memory management is disabled. If omitted, a default SimpleAgentMemory instance is used.
             verbose: If True, enable logging output. When False (default), logging is disabled. The log level can be controlled via the ACTON_LOG_LEVEL environment variable when verbose is True.
+            parallel_tool_calls: If True, the tool calls of a single step are executed concurrently in a thread pool instead of one after another. Results keep the order the model requested them in. Only enable this when the registered tools are safe to run concurrently.
+            max_tool_workers: Upper bound on the threads used when parallel_tool_calls is enabled, however many tool calls the model requests in one step. Defaults to min(8, os.cpu_count() + 4).
+            cache_tool_results: If True, successful tool results are reused for repeated calls with the same tool name and parameters within one run. The cache is cleared at the start of every run.
+
+        Raises:
+            ValueError: If max_tool_workers is less than 1.
         """
+        if max_tool_workers is not None and max_tool_workers < 1:
+            raise ValueError(f"max_tool_workers must be at least 1, got {max_tool_workers}")
+
         # Configure logging based on verbose parameter
         configure_logging(verbose=verbose)
 
@@ -112,6 +127,11 @@ class Agent:
         # Use SimpleAgentMemory by default if no custom memory provided
         self.memory: AgentMemory | None = memory if memory is not None else SimpleAgentMemory()
         self.verbose = verbose
+        self.parallel_tool_calls = parallel_tool_calls
+        self.max_tool_workers = max_tool_workers if max_tool_workers is not None else min(8, (os.cpu_count() or 1) + 4)
+        self.cache_tool_results = cache_tool_results
+        # Maps (tool_name, canonical parameters JSON) -> successful result text for the current run
+        self._tool_result_cache: dict[tuple[str, str], str] = {}
 
         self.tool_registry = ToolRegistry()
         self.conversation_history: list[Message] = []
@@ -162,7 +182,7 @@ class Agent:
         """
         Build the ordered message list to send to the LLM.
 
-        The first message is a system message containing the agent's system prompt, the current date and time in the agent's configured timezone (falls back to UTC on error), and the tool registry formatted for inclusion in prompts. The remaining messages are the current conversation history in chronological order.
+        The first message is a system message containing the agent's system prompt, the tool registry formatted for inclusion in prompts, and the current date and time in the agent's configured timezone (falls back to UTC on error). The date and time come last so that the rest of the system message stays an identical prefix across turns, which lets provider-side prompt caching reuse it. The remaining messages are the current conversation history in chronological order.
 
         Automatically manages conversation history using the configured memory instance (if any).
 
@@ -188,7 +208,7 @@ class Agent:
         messages = [
             Message(
                 role="system",
-                content=f"{self.system_prompt}\n\nCurrent Date and Time: {datetime_str}\n\n{self.tool_registry.format_for_prompt()}",
+                content=f"{self.system_prompt}\n\n{self.tool_registry.format_for_prompt()}\n\nCurrent Date and Time: {datetime_str}",
             )
         ]
         messages.extend(managed_history)
@@ -216,9 +236,9 @@ class Agent:
             Returns:
                 str: The tool's execution result string.
             """
-            logger.debug(f"Executing tool: {tool.name} with parameters: {parameters}")
+            logger.debug("Executing tool: {} with parameters: {}", tool.name, parameters)
             result = tool.execute(parameters)
-            logger.debug(f"Tool {tool.name} execution completed")
+            logger.debug("Tool {} execution completed", tool.name)
             return result
 
         try:
@@ -229,66 +249,163 @@ class Agent:
             logger.error(f"Tool {tool.name} failed after {self.retry_config.max_attempts} attempts: {e}")
             raise ToolExecutionError(tool.name, e) from e
 
-    def _execute_tool_calls(self, tool_calls: list[ToolCall]) -> list[ToolResult]:
+    def _execute_tool_call(self, tool_call: ToolCall) -> ToolResult:
         """
-        Execute a sequence of ToolCall requests and return their ToolResult entries in order.
+        Resolve a single ToolCall against the registry, execute it, and wrap the outcome in a ToolResult.
+
+        If the tool name is not registered, the ToolResult contains an error "Tool '<name>' not found". If the tool's output begins with the literal text "Error", that text is recorded in the ToolResult's `error` field and the `result` is set to an empty string. If execution raises a ToolExecutionError, the exception message is recorded in the `error` field and the `result` is an empty string.
+
+        When cache_tool_results is enabled, a call whose tool name and parameters match an earlier successful call in the same run returns that call's result without executing the tool again. Failed calls are never cached.
+
+        Parameters:
+            tool_call (ToolCall): The tool call to execute.
+
+        Returns:
+            ToolResult: The result or error details for the call.
+        """
+        cache_key = None
+        if self.cache_tool_results:
+            cache_key = self._tool_cache_key(tool_call)
+            cached = self._tool_result_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Reusing cached result for tool {}", tool_call.tool_name)
+                return ToolResult(tool_call_id=tool_call.id, tool_name=tool_call.tool_name, result=cached)
+
+        tool = self.tool_registry.get(tool_call.tool_name)
+
+        if tool is None:
+            logger.error(f"Tool not found: {tool_call.tool_name}")
+            return ToolResult(
+                tool_call_id=tool_call.id,
+                tool_name=tool_call.tool_name,
+                result="",
+                error=f"Tool '{tool_call.tool_name}' not found",
+            )
+
+        try:
+            # Execute with retry
+            result_text = self._execute_single_tool(tool, tool_call.parameters)
+        except ToolExecutionError as e:
+            logger.error(f"Tool {tool_call.tool_name} execution failed: {e}")
+            return ToolResult(
+                tool_call_id=tool_call.id,
+                tool_name=tool_call.tool_name,
+                result="",
+                error=str(e),
+            )
+
+        # Check if result indicates an error
+        error = None
+        if result_text.startswith("Error"):
+            error = result_text
+            result_text = ""
+
+        result = ToolResult(
+            tool_call_id=tool_call.id,
+            tool_name=tool_call.tool_name,
+            result=result_text,
+            error=error,
+        )
+
+        if result.success:
+            logger.success(f"Tool {tool_call.tool_name} executed successfully")
+            if cache_key is not None:
+                self._tool_result_cache[cache_key] = result_text
+        else:
+            logger.warning(f"Tool {tool_call.tool_name} returned error: {error}")
+
+        return result
+
+    @staticmethod
+    def _tool_cache_key(tool_call: ToolCall) -> tuple[str, str]:
+        """
+        Build the key under which a tool call's result is cached and identical calls are grouped.
+
+        Parameters:
+            tool_call (ToolCall): The tool call to key.
+
+        Returns:
+            tuple[str, str]: The tool name and the call's parameters as canonical (key-sorted) JSON.
+        """
+        return (tool_call.tool_name, json.dumps(tool_call.parameters, sort_keys=True, default=str))
+
+    def _submit_tool_calls(self, executor: ThreadPoolExecutor, tool_calls: list[ToolCall]) -> list[Future[ToolResult]]:
+        """
+        Submit a step's tool calls to a thread pool and return one future per call, in input order.
 
-        Each ToolCall is resolved against the agent's registry and invoked with the call's parameters. If a tool name is not registered, the corresponding ToolResult contains an error "Tool '<name>' not found". If a tool's execution output begins with the literal text "Error", that text is recorded in the ToolResult's `error` field and the `result` is set to an empty string. If execution raises a ToolExecutionError, the exception message is recorded in the `error` field and the `result` is an empty string.
+        When cache_tool_results is enabled, calls with the same tool name and parameters are executed only once and
+        share a future, since concurrent duplicates would otherwise all miss the cache. Use _tool_call_result() to
+        read each future so shared results carry the right tool_call_id.
 
         Parameters:
+            executor (ThreadPoolExecutor): The pool to submit the calls to.
             tool_calls (List[ToolCall]): Ordered tool calls to execute.
 
         Returns:
-            List[ToolResult]: ToolResult objects corresponding to each input ToolCall, in the same order.
+            List[Future[ToolResult]]: Futures corresponding to each input ToolCall, in the same order.
         """
-        results = []
+        if not self.cache_tool_results:
+            return [executor.submit(self._execute_tool_call, tool_call) for tool_call in tool_calls]
 
+        futures_by_key: dict[tuple[str, str], Future[ToolResult]] = {}
+        futures = []
         for tool_call in tool_calls:
-            tool = self.tool_registry.get(tool_call.tool_name)
+            key = self._tool_cache_key(tool_call)
+            if key not in futures_by_key:
+                futures_by_key[key] = executor.submit(self._execute_tool_call, tool_call)
+            futures.append(futures_by_key[key])
+        return futures
 
-            if tool is None:
-                result = ToolResult(
-                    tool_call_id=tool_call.id,
-                    tool_name=tool_call.tool_name,
-                    result="",
-                    error=f"Tool '{tool_call.tool_name}' not found",
-                )
-                logger.error(f"Tool not found: {tool_call.tool_name}")
-            else:
-                try:
-                    # Execute with retry
-                    result_text = self._execute_single_tool(tool, tool_call.parameters)
+    @staticmethod
+    def _tool_call_result(tool_call: ToolCall, future: Future[ToolResult]) -> ToolResult:
+        """
+        Wait for a submitted tool call and return its result addressed to that call.
 
-                    # Check if result indicates an error
-                    error = None
-                    if result_text.startswith("Error"):
-                        error = result_text
-                        result_text = ""
+        Parameters:
+            tool_call (ToolCall): The tool call the future was returned for.
+            future (Future[ToolResult]): The future from _submit_tool_calls(), possibly shared with identical calls.
 
-                    result = ToolResult(
-                        tool_call_id=tool_call.id,
-                        tool_name=tool_call.tool_name,
-                        result=result_text,
-                        error=error,
-                    )
+        Returns:
+            ToolResult: The call's result, with tool_call_id set to the id of `tool_call`.
+        """
+        result = future.result()
+        if result.tool_call_id != tool_call.id:
+            result = result.model_copy(update={"tool_call_id": tool_call.id})
+        return result
 
-                    if result.success:
-                        logger.success(f"Tool {tool_call.tool_name} executed successfully")
-                    else:
-                        logger.warning(f"Tool {tool_call.tool_name} returned error: {error}")
+    def _tool_executor(self, tool_calls: list[ToolCall]) -> ThreadPoolExecutor:
+        """
+        Create the thread pool used to run a step's tool calls concurrently.
 
-                except ToolExecutionError as e:
-                    logger.error(f"Tool {tool_call.tool_name} execution failed: {e}")
-                    result = ToolResult(
-                        tool_call_id=tool_call.id,
-                        tool_name=tool_call.tool_name,
-                        result="",
-                        error=str(e),
-                    )
+        Parameters:
+            tool_calls (List[ToolCall]): The tool calls that will be submitted to the pool.
 
-            results.append(result)
+        Returns:
+            ThreadPoolExecutor: A pool with one thread per tool call, capped at max_tool_workers.
+        """
+        return ThreadPoolExecutor(max_workers=min(len(tool_calls), self.max_tool_workers))
 
-        return results
+    def _execute_tool_calls(self, tool_calls: list[ToolCall]) -> list[ToolResult]:
+        """
+        Execute a sequence of ToolCall requests and return their ToolResult entries in order.
+
+        Each ToolCall is handled by _execute_tool_call(). When parallel_tool_calls is enabled and there is more than one call, the calls run concurrently in a thread pool of at most max_tool_workers threads; the results are still returned in input order. With cache_tool_results also enabled, identical calls in the step are executed once and share the result.
+
+        Parameters:
+            tool_calls (List[ToolCall]): Ordered tool calls to execute.
+
+        Returns:
+            List[ToolResult]: ToolResult objects corresponding to each input ToolCall, in the same order.
+        """
+        if self.parallel_tool_calls and len(tool_calls) > 1:
+            with self._tool_executor(tool_calls) as executor:
+                futures = self._submit_tool_calls(executor, tool_calls)
+                return [
+                    self._tool_call_result(tool_call, future)
+                    for tool_call, future in zip(tool_calls, futures, strict=True)
+                ]
+
+        return [self._execute_tool_call(tool_call) for tool_call in tool_calls]
 
     def _execute_tool_calls_stream(
         self, tool_calls: list[ToolCall], step_id: str
@@ -298,6 +415,8 @@ class Agent:
 
         Executes each ToolCall in order, yielding AgentToolExecutionEvent items with status "started", "completed", or "failed" for that step. Each emitted event includes the provided step_id, the tool call id, the tool name, and—when available—the resulting ToolResult. Execution continues through all provided calls and the final return value is the ordered list of ToolResult objects corresponding to the input calls.
 
+        When parallel_tool_calls is enabled and there is more than one call, "started" events are emitted for every call up front, the calls run concurrently in a thread pool, and the "completed"/"failed" events follow in input order.
+
         Parameters:
             tool_calls (List[ToolCall]): Ordered tool call requests to execute.
             step_id (str): Identifier included on each emitted AgentToolExecutionEvent to correlate events with a higher-level agent step.
@@ -310,90 +429,49 @@ class Agent:
         """
         results = []
 
-        for tool_call in tool_calls:
-            # Emit started event
-            yield AgentToolExecutionEvent(
-                step_id=step_id,
-                tool_call_id=tool_call.id,
-                tool_name=tool_call.tool_name,
-                status="started",
-            )
-
-            tool = self.tool_registry.get(tool_call.tool_name)
-
-            if tool is None:
-                result = ToolResult(
-                    tool_call_id=tool_call.id,
-                    tool_name=tool_call.tool_name,
-                    result="",
-                    error=f"Tool '{tool_call.tool_name}' not found",
-                )
-                logger.error(f"Tool not found: {tool_call.tool_name}")
-
-                # Emit failed event
+        if self.parallel_tool_calls and len(tool_calls) > 1:
+            for tool_call in tool_calls:
                 yield AgentToolExecutionEvent(
                     step_id=step_id,
                     tool_call_id=tool_call.id,
                     tool_name=tool_call.tool_name,
-                    status="failed",
-                    result=result,
+                    status="started",
                 )
-            else:
-                try:
-                    # Execute with retry
-                    result_text = self._execute_single_tool(tool, tool_call.parameters)
-
-                    # Check if result indicates an error
-                    error = None
-                    if result_text.startswith("Error"):
-                        error = result_text
-                        result_text = ""
-
-                    result = ToolResult(
-                        tool_call_id=tool_call.id,
-                        tool_name=tool_call.tool_name,
-                        result=result_text,
-                        error=error,
-                    )
 
-                    if result.success:
-                        logger.success(f"Tool {tool_call.tool_name} executed successfully")
-                        # Emit completed event
-                        yield AgentToolExecutionEvent(
-                            step_id=step_id,
-                            tool_call_id=tool_call.id,
-                            tool_name=tool_call.tool_name,
-                            status="completed",
-                            result=result,
-                        )
-                    else:
-                        logger.warning(f"Tool {tool_call.tool_name} returned error: {error}")
-                        # Emit failed event
-                        yield AgentToolExecutionEvent(
-                            step_id=step_id,
-                            tool_call_id=tool_call.id,
-                            tool_name=tool_call.tool_name,
-                            status="failed",
-                            result=result,
-                        )
-
-                except ToolExecutionError as e:
-                    logger.error(f"Tool {tool_call.tool_name} execution failed: {e}")
-                    result = ToolResult(
-                        tool_call_id=tool_call.id,
-                        tool_name=tool_call.tool_name,
-                        result="",
-                        error=str(e),
-                    )
-
-                    # Emit failed event
+            with self._tool_executor(tool_calls) as executor:
+                futures = self._submit_tool_calls(executor, tool_calls)
+                for tool_call, future in zip(tool_calls, futures, strict=True):
+                    result = self._tool_call_result(tool_call, future)
                     yield AgentToolExecutionEvent(
                         step_id=step_id,
                         tool_call_id=tool_call.id,
                         tool_name=tool_call.tool_name,
-                        status="failed",
+                        status="completed" if result.success else "failed",
                         result=result,
                     )
+                    results.append(result)
+
+            return results
+
+        for tool_call in tool_calls:
+            # Emit started event
+            yield AgentToolExecutionEvent(
+                step_id=step_id,
+                tool_call_id=tool_call.id,
+                tool_name=tool_call.tool_name,
+                status="started",
+            )
+
+            result = self._execute_tool_call(tool_call)
+
+            # Emit completed or failed event
+            yield AgentToolExecutionEvent(
+                step_id=step_id,
+                tool_call_id=tool_call.id,
+                tool_name=tool_call.tool_name,
+                status="completed" if result.success else "failed",
+                result=result,
+            )
 
             results.append(result)
 
@@ -525,6 +603,7 @@ class Agent:
         """
         logger.info(f"Agent starting run with input: {user_input[:100]}...")
         self.conversation_history.append(Message(role="user", content=user_input))
+        self._tool_result_cache.clear()
 
         for iteration in range(1, self.max_iterations + 1):
             logger.info(f"Agent iteration {iteration}/{self.max_iterations}")
@@ -78,13 +78,13 @@ class ResponseParser:
 
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse JSON response, treating as final answer: {e}")
-            logger.debug(f"Raw response text: {response_text[:200]}...")
+            logger.debug("Raw response text: {}...", response_text[:200])
             # Fallback: treat entire response as final answer
             return AgentFinalResponse(final_answer=response_text)
 
         except Exception as e:
             logger.error(f"Error parsing response: {e}")
-            logger.debug(f"Raw response text: {response_text[:200]}...")
+            logger.debug("Raw response text: {}...", response_text[:200])
             # Last resort fallback
             return AgentFinalResponse(final_answer=f"Error parsing response: {e!s}")
 
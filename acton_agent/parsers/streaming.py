@@ -175,7 +175,7 @@ class StreamingTokenParser:
                 detected_type = self._detect_event_type_from_partial(data)
                 if detected_type != "unknown":
                     self.detected_types[step_id] = detected_type
-                    logger.debug(f"🎯 Early detection: {detected_type} (step_id={step_id})")
+                    logger.debug("🎯 Early detection: {} (step_id={})", detected_type, step_id)
 
             if detected_type == "plan" and "plan" in data:
                 plan_str = str(data["plan"]) if data["plan"] else ""
@@ -282,7 +282,7 @@ def parse_streaming_events(
             current_step_id = event.step_id
             stream_active = True
             last_complete = False
-            logger.debug(f"🚀 Stream started (step_id={current_step_id})")
+            logger.debug("🚀 Stream started (step_id={})", current_step_id)
 
         elif isinstance(event, AgentToken):
             if current_step_id:
@@ -324,5 +324,5 @@ def parse_streaming_events(
             yield processed_event
 
         else:
-            logger.debug(f"➡️ Passing through: {type(event).__name__}")
+            logger.debug("➡️ Passing through: {}", type(event).__name__)
             yield event
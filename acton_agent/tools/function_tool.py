@@ -2,8 +2,11 @@
 FunctionTool - Wraps Python functions as tools.
 """
 
+import asyncio
+import inspect
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from loguru import logger
@@ -12,12 +15,46 @@ from .base import Tool
 from .models import ConfigSchema, ToolInputSchema
 
 
+def _run_coroutine(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine to completion from synchronous code and return its result.
+
+    When the calling thread has no running event loop the coroutine runs on a fresh loop via asyncio.run().
+    asyncio.run() cannot be nested inside a running loop (e.g. in Jupyter or an async web handler), so in
+    that case the coroutine runs on a fresh loop in a helper thread while the caller waits for it.
+
+    Parameters:
+        coro (Coroutine): The coroutine to run.
+
+    Returns:
+        Any: The value returned by the coroutine.
+
+    Raises:
+        Exception: Re-raises any exception raised by the coroutine.
+    """
+    try:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+    except BaseException:
+        # Avoid "coroutine was never awaited" warnings if it could not be started
+        coro.close()
+        raise
+
+
 class FunctionTool(Tool):
     """
     Tool that wraps a Python function.
 
     This is a convenient way to create tools from existing Python functions
-    without having to create a custom Tool subclass.
+    without having to create a custom Tool subclass. Both regular and
+    ``async def`` functions are supported; coroutines are run to completion
+    before execute() returns, on a helper thread if the caller is already
+    running an event loop.
 
     Uses Pydantic-based input schemas and configuration.
     """
@@ -50,6 +87,10 @@ class FunctionTool(Tool):
 
         self.func = func
 
+        # JSON schema generated from input_schema, rebuilt only if input_schema is replaced
+        self._schema_source = input_schema
+        self._schema = self._build_schema()
+
     def execute(self, parameters: dict[str, Any]) -> str:
         """
         Run the wrapped function with the provided parameters.
@@ -67,7 +108,7 @@ class FunctionTool(Tool):
             # Validate input parameters if input_schema is provided
             if self.input_schema is not None:
                 try:
-                    validated_params = self.input_schema(**parameters)
+                    validated_params = self.input_schema.model_validate(parameters)
                     # Convert Pydantic model back to dict for function call
                     parameters = validated_params.model_dump()
                 except Exception as e:
@@ -80,6 +121,9 @@ class FunctionTool(Tool):
             merged_params.update(parameters)
 
             result = self.func(**merged_params)
+            # Coroutine functions are run to completion on a fresh event loop
+            if inspect.iscoroutine(result):
+                result = _run_coroutine(result)
 
             # Convert result to string
             if isinstance(result, str):
@@ -95,11 +139,24 @@ class FunctionTool(Tool):
         Get the JSON Schema describing this tool's parameters.
 
         Returns the JSON schema generated from the Pydantic input_schema model,
-        or an empty object schema if no input_schema is defined.
+        or an empty object schema if no input_schema is defined. The schema is
+        generated once and reused until input_schema is replaced.
 
         Returns:
             dict[str, Any]: The JSON Schema that describes the tool's parameters.
         """
+        if self._schema_source is not self.input_schema:
+            self._schema_source = self.input_schema
+            self._schema = self._build_schema()
+        return self._schema
+
+    def _build_schema(self) -> dict[str, Any]:
+        """
+        Generate the JSON Schema for this tool's parameters.
+
+        Returns:
+            dict[str, Any]: The schema of input_schema, or an empty object schema if no input_schema is defined.
+        """
         if self.input_schema is not None:
             # Generate JSON schema from Pydantic model
             return self.input_schema.model_json_schema()
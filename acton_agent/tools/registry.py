@@ -3,6 +3,7 @@ Tool registry for managing tools and toolsets.
 """
 
 import json
+from collections.abc import Iterable, Iterator, KeysView, ValuesView
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
@@ -31,26 +32,101 @@ class ToolRegistry:
         Initializes:
         - _tools: mapping of tool name to Tool
         - _toolsets: mapping of toolset name to ToolSet
-        - _tool_to_toolset: mapping of tool name to its containing toolset name
+        - _toolset_tool_names: mapping of toolset name to the names of the tools it registered
+        - _tool_toolset: mapping of tool name to the ToolSet it was registered through
+        - _toolset_member_names: names of all tools that belong to a registered toolset
+        - _standalone_names: names of registered tools outside any toolset, in registration order
+        - _schema_json: mapping of tool name to the schema object last serialized and its JSON text
+        - _version: counter bumped on every mutation, used to invalidate the cached prompt
         """
         self._tools: dict[str, Tool] = {}
         self._toolsets: dict[str, ToolSet] = {}
-        self._tool_to_toolset: dict[str, str] = {}  # Maps tool_name -> toolset_name
+        self._toolset_tool_names: dict[str, set[str]] = {}  # Maps toolset_name -> tool names
+        self._tool_toolset: dict[str, ToolSet] = {}  # Maps tool_name -> owning toolset
+        self._toolset_member_names: set[str] = set()
+        self._standalone_names: dict[str, None] = {}  # Insertion-ordered set of standalone tool names
+        self._schema_json: dict[str, tuple[dict[str, Any], str]] = {}  # Maps tool_name -> (schema, JSON or "")
+        self._version = 0
+        self._cached_prompt: str | None = None
+        self._cached_prompt_version = -1
+        self._cached_summary: str | None = None
+        self._cached_summary_version = -1
+
+    def _invalidate(self) -> None:
+        """
+        Mark the registry as modified so the cached prompt text is rebuilt on next use.
+        """
+        self._version += 1
+        self._cached_prompt = None
+
+    @staticmethod
+    def _serialize_schema(schema: dict[str, Any]) -> str:
+        """
+        Serialize a tool's JSON schema for inclusion in prompts.
+
+        Parameters:
+            schema (dict[str, Any]): The schema returned by the tool's get_schema().
+
+        Returns:
+            str: The schema as compact JSON, or an empty string if the schema is empty.
+        """
+        return json.dumps(schema, separators=(",", ":"), ensure_ascii=False) if schema else ""
+
+    def _schema_text(self, tool: Tool) -> str:
+        """
+        Return the serialized schema for a tool, reusing the cached JSON while get_schema() returns the same object.
+
+        Tools such as FunctionTool return the same schema object until their schema changes, so an identity check
+        is enough to detect a replaced schema without comparing contents.
+
+        Parameters:
+            tool (Tool): The tool whose serialized schema is needed.
+
+        Returns:
+            str: The serialized schema, or an empty string if the tool has no schema.
+        """
+        schema = tool.get_schema()
+        cached = self._schema_json.get(tool.name)
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        schema_json = self._serialize_schema(schema)
+        if self._tools.get(tool.name) is tool:
+            self._schema_json[tool.name] = (schema, schema_json)
+        return schema_json
 
     def register(self, tool: Tool) -> None:
         """
         Register a tool in the registry under its name.
 
-        If a tool with the same name already exists, it will be overwritten.
+        If a tool with the same name already exists, it will be overwritten. A tool registered directly does not
+        receive toolset configuration, even if it replaces a tool that came from a toolset.
 
         Parameters:
             tool (Tool): The Tool instance to register.
         """
         if tool.name in self._tools:
-            logger.warning(f"Tool '{tool.name}' already registered, overwriting")
+            logger.warning("Tool '{}' already registered, overwriting", tool.name)
 
+        self._register_fast(tool)
+        self._tool_toolset.pop(tool.name, None)
+        if tool.name not in self._toolset_member_names:
+            self._standalone_names[tool.name] = None
+        self._invalidate()
+        logger.info("Registered tool: {}", tool.name)
+
+    def _register_fast(self, tool: Tool) -> None:
+        """
+        Store a tool without the per-tool logging and cache invalidation done by register().
+
+        Callers registering tools in bulk are responsible for calling _invalidate() once afterwards.
+
+        Parameters:
+            tool (Tool): The Tool instance to store.
+        """
         self._tools[tool.name] = tool
-        logger.info(f"Registered tool: {tool.name}")
+        schema = tool.get_schema()
+        self._schema_json[tool.name] = (schema, self._serialize_schema(schema))
 
     def unregister(self, tool_name: str) -> None:
         """
@@ -59,11 +135,16 @@ class ToolRegistry:
         Raises:
             ToolNotFoundError: If no tool with the given name is registered.
         """
-        if tool_name not in self._tools:
-            raise ToolNotFoundError(tool_name)
+        try:
+            self._tools.pop(tool_name)
+        except KeyError:
+            raise ToolNotFoundError(tool_name) from None
 
-        del self._tools[tool_name]
-        logger.info(f"Unregistered tool: {tool_name}")
+        self._tool_toolset.pop(tool_name, None)
+        self._schema_json.pop(tool_name, None)
+        self._standalone_names.pop(tool_name, None)
+        self._invalidate()
+        logger.info("Unregistered tool: {}", tool_name)
 
     def get(self, tool_name: str) -> Tool | None:
         """
@@ -79,7 +160,9 @@ class ToolRegistry:
 
     def list_tools(self) -> list[Tool]:
         """
-        Get all registered tools.
+        Get all registered tools as a new list.
+
+        Use iter_tools() when the tools only need to be iterated over.
 
         Returns:
             List of all registered tool instances
@@ -88,13 +171,37 @@ class ToolRegistry:
 
     def list_tool_names(self) -> list[str]:
         """
-        List the names of all registered tools.
+        List the names of all registered tools as a new list.
+
+        Use iter_tool_names() when the names only need to be iterated over.
 
         Returns:
             A list of registered tool names.
         """
         return list(self._tools.keys())
 
+    def iter_tools(self) -> ValuesView[Tool]:
+        """
+        Get a live, read-only view of the registered tools without copying them into a list.
+
+        The view reflects later registry changes and must not be iterated while the registry is being modified.
+
+        Returns:
+            ValuesView[Tool]: View over the registered tool instances in registration order.
+        """
+        return self._tools.values()
+
+    def iter_tool_names(self) -> KeysView[str]:
+        """
+        Get a live, read-only view of the registered tool names without copying them into a list.
+
+        The view reflects later registry changes and must not be iterated while the registry is being modified.
+
+        Returns:
+            KeysView[str]: View over the registered tool names in registration order.
+        """
+        return self._tools.keys()
+
     def has_tool(self, tool_name: str) -> bool:
         """
         Check whether a tool with the given name is registered.
@@ -104,6 +211,20 @@ class ToolRegistry:
         """
         return tool_name in self._tools
 
+    def known_names(self, names: Iterable[str]) -> set[str]:
+        """
+        Return which of the given tool names are registered, in a single set intersection.
+
+        Parameters:
+            names (Iterable[str]): Tool names to check, e.g. the tool names requested by an LLM response.
+
+        Returns:
+            set[str]: The subset of `names` that are registered in the registry.
+        """
+        if not isinstance(names, (set, frozenset)):
+            names = set(names)
+        return self._tools.keys() & names
+
     def register_toolset(self, toolset: "ToolSet") -> None:
         """
         Register a ToolSet and add its tools to the registry.
@@ -116,15 +237,23 @@ class ToolRegistry:
         """
 
         if toolset.name in self._toolsets:
-            logger.warning(f"ToolSet '{toolset.name}' already registered, overwriting")
+            logger.warning("ToolSet '{}' already registered, overwriting", toolset.name)
 
         self._toolsets[toolset.name] = toolset
 
+        tool_names = {tool.name for tool in toolset.tools}
+        overwritten = self.known_names(tool_names)
+        if overwritten:
+            logger.warning("ToolSet '{}' overwrites already registered tools: {}", toolset.name, sorted(overwritten))
+
         for tool in toolset.tools:
-            self.register(tool)
-            self._tool_to_toolset[tool.name] = toolset.name
+            self._register_fast(tool)
+            self._tool_toolset[tool.name] = toolset
 
-        logger.info(f"Registered toolset: {toolset.name} with {len(toolset.tools)} tools")
+        self._toolset_tool_names[toolset.name] = tool_names
+        self._refresh_toolset_members()
+        self._invalidate()
+        logger.info("Registered toolset: {} with {} tools", toolset.name, len(toolset.tools))
 
     def unregister_toolset(self, toolset_name: str) -> None:
         """
@@ -139,18 +268,27 @@ class ToolRegistry:
         if toolset_name not in self._toolsets:
             raise ValueError(f"ToolSet '{toolset_name}' not found")
 
-        toolset = self._toolsets[toolset_name]
+        # Unregister all tools in the toolset
+        del self._toolsets[toolset_name]
+        for name in self._toolset_tool_names.pop(toolset_name):
+            self._tools.pop(name, None)
+            self._tool_toolset.pop(name, None)
+            self._schema_json.pop(name, None)
 
-        # Unregister all tools in the toolset and remove from mapping
-        for tool in toolset.tools:
-            if tool.name in self._tools:
-                del self._tools[tool.name]
-            if tool.name in self._tool_to_toolset:
-                del self._tool_to_toolset[tool.name]
+        self._refresh_toolset_members()
+        self._invalidate()
+        logger.info("Unregistered toolset: {}", toolset_name)
 
-        # Remove the toolset
-        del self._toolsets[toolset_name]
-        logger.info(f"Unregistered toolset: {toolset_name}")
+    def _refresh_toolset_members(self) -> None:
+        """
+        Recompute the set of tool names that belong to any registered toolset, and the standalone names with it.
+
+        Called whenever toolsets are added, replaced, or removed so the prompt formatter does not have to rebuild them.
+        Standalone names are rebuilt from the tool mapping so they keep the registry's order.
+        """
+        members = set().union(*self._toolset_tool_names.values())
+        self._toolset_member_names = members
+        self._standalone_names = {name: None for name in self._tools if name not in members}
 
     def list_toolsets(self) -> list[str]:
         """
@@ -171,12 +309,14 @@ class ToolRegistry:
         Returns:
             dict[str, Any] | None: The toolset configuration dictionary if the tool belongs to a toolset, `None` otherwise.
         """
-        toolset_name = self._tool_to_toolset.get(tool_name)
-        if toolset_name:
-            toolset = self._toolsets.get(toolset_name)
-            if toolset:
-                return toolset.config
-        return None
+        toolset = self._tool_toolset.get(tool_name)
+        if toolset is None:
+            return None
+
+        # A toolset that was replaced under the same name no longer applies to its old tools
+        if self._toolsets.get(toolset.name) is not toolset:
+            return None
+        return toolset.config
 
     def format_for_prompt(self) -> str:
         """
@@ -184,70 +324,152 @@ class ToolRegistry:
 
         Toolsets are listed first with their name, description, and contained tool names; tools are then grouped by toolset and standalone tools follow. Each tool entry includes its name, description, and the tool's JSON schema when available.
 
+        The result is cached and reused until the registry is mutated through one of its register, unregister, or clear methods.
+        A tool whose schema or description changes after registration should be registered again so the listing is
+        rebuilt; schemas are re-serialized whenever a tool's get_schema() returns a different object.
+
         Returns:
             str: Formatted text describing available toolsets and tools, or "No tools available." if the registry is empty.
         """
+        if self._cached_prompt is not None and self._cached_prompt_version == self._version:
+            return self._cached_prompt
+
         if not self._tools and not self._toolsets:
             return "No tools available."
 
-        tools_text = ""
+        tools_text = "".join(self.iter_prompt_lines())
+        self._cached_prompt = tools_text
+        self._cached_prompt_version = self._version
+        return tools_text
+
+    def iter_prompt_lines(self) -> Iterator[str]:
+        """
+        Yield the text of format_for_prompt() piece by piece instead of as one string.
+
+        Useful for consumers that accept an iterable of chunks, such as streaming request encoders, so a large
+        listing never has to be held in memory in full. When format_for_prompt() has already cached the listing
+        for the current registry state, the cached string is yielded as a single chunk.
+
+        Returns:
+            Iterator[str]: Chunks whose concatenation equals format_for_prompt().
+        """
+        if self._cached_prompt is not None and self._cached_prompt_version == self._version:
+            yield self._cached_prompt
+            return
+
+        if not self._tools and not self._toolsets:
+            yield "No tools available."
+            return
 
         # Format toolsets first
         if self._toolsets:
-            tools_text += "AVAILABLE TOOLSETS:\n\n"
-            for _toolset_name, toolset in self._toolsets.items():
-                tools_text += f"ToolSet: {toolset.name}\n"
-                tools_text += f"Description: {toolset.description}\n"
-                tools_text += f"Tools in this set: {', '.join([tool.name for tool in toolset.tools])}\n\n"
+            yield "AVAILABLE TOOLSETS:\n\n"
+            for toolset in self._toolsets.values():
+                yield f"ToolSet: {toolset.name}\n"
+                yield f"Description: {toolset.description}\n"
+                yield f"Tools in this set: {', '.join([tool.name for tool in toolset.tools])}\n\n"
 
         # Format individual tools
-        tools_text += "AVAILABLE TOOLS:\n\n"
-
-        # Group tools by toolset
-        toolset_tools = set()
-        for toolset in self._toolsets.values():
-            for tool in toolset.tools:
-                toolset_tools.add(tool.name)
+        yield "AVAILABLE TOOLS:\n\n"
 
         # Format tools that belong to toolsets
         for toolset in self._toolsets.values():
-            tools_text += f"--- Tools from {toolset.name} ---\n"
+            yield f"--- Tools from {toolset.name} ---\n"
             for tool in toolset.tools:
-                tools_text += f"Tool: {tool.name}\n"
-                tools_text += f"Description: {tool.description}\n"
+                yield from self._iter_tool_entry(tool)
 
-                schema = tool.get_schema()
-                if schema:
-                    tools_text += f"Schema: {json.dumps(schema, indent=2)}\n"
+        # Format standalone tools (not in any toolset)
+        if self._standalone_names:
+            yield "--- Standalone Tools ---\n"
+            for name in self._standalone_names:
+                yield from self._iter_tool_entry(self._tools[name])
 
-                tools_text += "\n"
+    def format_summary_pool(self) -> str:
+        """
+        Build a compact listing of every registered tool as one "name: description" line per tool.
 
-        # Format standalone tools (not in any toolset)
-        standalone_tools = [tool for tool in self._tools.values() if tool.name not in toolset_tools]
+        Only the first line of each description is used. This is the first phase of a two-phase tool prompt: the
+        summary pool stays small regardless of schema sizes, and full schemas are added separately for the tools
+        that are actually needed via format_promoted_schemas(). The summary only changes when the registry does,
+        so it is cached and should be placed before per-turn content to keep the prompt prefix cacheable.
 
-        if standalone_tools:
-            tools_text += "--- Standalone Tools ---\n"
-            for tool in standalone_tools:
-                tools_text += f"Tool: {tool.name}\n"
-                tools_text += f"Description: {tool.description}\n"
+        Returns:
+            str: Newline-separated tool summaries, or "No tools available." if the registry is empty.
+        """
+        if self._cached_summary is not None and self._cached_summary_version == self._version:
+            return self._cached_summary
 
-                schema = tool.get_schema()
-                if schema:
-                    tools_text += f"Schema: {json.dumps(schema, indent=2)}\n"
+        if not self._tools:
+            return "No tools available."
 
-                tools_text += "\n"
+        lines = []
+        for tool in self._tools.values():
+            summary = tool.description.strip().partition("\n")[0]
+            lines.append(f"{tool.name}: {summary}")
 
-        return tools_text
+        self._cached_summary = "\n".join(lines)
+        self._cached_summary_version = self._version
+        return self._cached_summary
+
+    def format_promoted_schemas(self, names: Iterable[str]) -> str:
+        """
+        Build the full-schema entries for a selected subset of registered tools.
+
+        This is the second phase of a two-phase tool prompt, using the same compact schema serialization as
+        format_for_prompt(). Tools are emitted in registration order; names that are not registered are ignored.
+
+        Parameters:
+            names (Iterable[str]): Names of the tools whose schemas should be included.
+
+        Returns:
+            str: Formatted entries with each selected tool's name, description, and compact JSON schema, or an empty string if none of the names are registered.
+        """
+        selected = set(names)
+        parts: list[str] = []
+        for tool in self._tools.values():
+            if tool.name not in selected:
+                continue
+            parts.append(f"Tool: {tool.name}\n")
+            parts.append(f"Description: {tool.description}\n")
+            schema_json = self._schema_text(tool)
+            if schema_json:
+                parts.append(f"Schema: {schema_json}\n")
+            parts.append("\n")
+        return "".join(parts)
+
+    def _iter_tool_entry(self, tool: Tool) -> Iterator[str]:
+        """
+        Yield the prompt lines describing a single tool.
+
+        Parameters:
+            tool (Tool): The tool to describe.
+
+        Returns:
+            Iterator[str]: The tool's name, description, and schema lines.
+        """
+        yield f"Tool: {tool.name}\n"
+        yield f"Description: {tool.description}\n"
+
+        schema_json = self._schema_text(tool)
+        if schema_json:
+            yield f"Schema: {schema_json}\n"
+
+        yield "\n"
 
     def clear(self) -> None:
         """
-        Clear all registered tools, toolsets, and the internal tool-to-toolset mapping.
+        Clear all registered tools and toolsets.
 
-        Removes every entry from the registry's internal storage for tools, toolsets, and the mapping that tracks which tool belongs to which toolset.
+        Removes every entry from the registry's internal storage.
         """
         self._tools.clear()
         self._toolsets.clear()
-        self._tool_to_toolset.clear()
+        self._toolset_tool_names.clear()
+        self._tool_toolset.clear()
+        self._toolset_member_names.clear()
+        self._standalone_names.clear()
+        self._schema_json.clear()
+        self._invalidate()
         logger.info("Cleared all tools from registry")
 
     def __len__(self) -> int:
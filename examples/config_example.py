@@ -8,6 +8,7 @@ exposing them to the LLM.
 """
 
 import os
+import sys
 from pydantic import Field
 from acton_agent import Agent, ToolSet, FunctionTool
 from acton_agent.client import OpenAIClient
@@ -196,6 +197,9 @@ def main():
     agent.register_toolset(database_toolset)
     agent.register_toolset(preferences_toolset)
 
+    # Only force a flush when someone is watching the terminal
+    flush = sys.stdout.isatty()
+
     print("\n" + "=" * 70)
     print("🔐 Welcome to the ToolSet Parameters Demo!")
     print("=" * 70)
@@ -214,7 +218,7 @@ def main():
     print("The API key is automatically injected from config.\n")
     query = "What's the weather in Seattle?"
     print(f"💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
@@ -228,7 +232,7 @@ def main():
     print("It's automatically injected when the tools execute.\n")
     query = "Get information about user 42"
     print(f"💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
@@ -242,7 +246,7 @@ def main():
     print("These are injected automatically from config.\n")
     query = "What is my notification setting?"
     print(f"💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
@@ -256,7 +260,7 @@ def main():
     print("Each tool gets its own hidden parameters automatically.\n")
     query = "Get the weather in Paris and also get user 10's orders"
     print(f"💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
@@ -8,6 +8,8 @@ for more complex or specialized functionality.
 
 import os
 import random
+import sys
+from typing import ClassVar
 
 from acton_agent import Agent, Tool
 from acton_agent.client import OpenAIClient
@@ -16,6 +18,12 @@ from acton_agent.client import OpenAIClient
 class WeatherTool(Tool):
     """Custom tool for getting weather information (simulated)."""
 
+    _SCHEMA: ClassVar[dict] = {
+        "type": "object",
+        "properties": {"city": {"type": "string", "description": "Name of the city"}},
+        "required": ["city"],
+    }
+
     def __init__(self):
         """
         Initialize the WeatherTool.
@@ -53,16 +61,33 @@ class WeatherTool(Tool):
         Returns:
             dict: A JSON Schema object defining a required string property "city".
         """
-        return {
-            "type": "object",
-            "properties": {"city": {"type": "string", "description": "Name of the city"}},
-            "required": ["city"],
-        }
+        return self._SCHEMA
 
 
 class DiceRollerTool(Tool):
     """Custom tool for rolling dice."""
 
+    _SCHEMA: ClassVar[dict] = {
+        "type": "object",
+        "properties": {
+            "num_dice": {
+                "type": "integer",
+                "description": "Number of dice to roll",
+                "default": 1,
+                "minimum": 1,
+                "maximum": 100,
+            },
+            "num_sides": {
+                "type": "integer",
+                "description": "Number of sides on each die",
+                "default": 6,
+                "minimum": 2,
+                "maximum": 1000,
+            },
+        },
+        "required": [],
+    }
+
     def __init__(self):
         """
         Create a DiceRollerTool configured with name "roll_dice" and a description indicating it rolls dice with configurable count and sides.
@@ -93,7 +118,7 @@ class DiceRollerTool(Tool):
         if num_sides < 2 or num_sides > 1000:
             return "Error: Number of sides must be between 2 and 1000"
 
-        rolls = [random.randint(1, num_sides) for _ in range(num_dice)]
+        rolls = random.choices(range(1, num_sides + 1), k=num_dice)
         total = sum(rolls)
 
         result = f"Rolling {num_dice}d{num_sides}:\n"
@@ -113,31 +138,18 @@ class DiceRollerTool(Tool):
         Returns:
             dict: A JSON Schema dictionary matching the described structure and constraints.
         """
-        return {
-            "type": "object",
-            "properties": {
-                "num_dice": {
-                    "type": "integer",
-                    "description": "Number of dice to roll",
-                    "default": 1,
-                    "minimum": 1,
-                    "maximum": 100,
-                },
-                "num_sides": {
-                    "type": "integer",
-                    "description": "Number of sides on each die",
-                    "default": 6,
-                    "minimum": 2,
-                    "maximum": 1000,
-                },
-            },
-            "required": [],
-        }
+        return self._SCHEMA
 
 
 class TextAnalyzerTool(Tool):
     """Custom tool for analyzing text properties."""
 
+    _SCHEMA: ClassVar[dict] = {
+        "type": "object",
+        "properties": {"text": {"type": "string", "description": "The text to analyze"}},
+        "required": ["text"],
+    }
+
     def __init__(self):
         """
         Initialize the TextAnalyzerTool with its tool name and human-readable description.
@@ -165,13 +177,13 @@ class TextAnalyzerTool(Tool):
             return "Error: No text provided"
 
         # Calculate statistics
+        words = text.split()
         char_count = len(text)
-        word_count = len(text.split())
+        word_count = len(words)
         sentence_count = text.count(".") + text.count("!") + text.count("?")
         line_count = text.count("\n") + 1
 
         # Find longest word
-        words = text.split()
         longest_word = max(words, key=len) if words else ""
 
         result = "Text Analysis:\n"
@@ -190,11 +202,7 @@ class TextAnalyzerTool(Tool):
 
         @returns A dict representing a JSON Schema that requires a single string property "text" (the text to analyze).
         """
-        return {
-            "type": "object",
-            "properties": {"text": {"type": "string", "description": "The text to analyze"}},
-            "required": ["text"],
-        }
+        return self._SCHEMA
 
 
 def main():
@@ -226,6 +234,9 @@ def main():
     agent.register_tool(dice_tool)
     agent.register_tool(text_analyzer_tool)
 
+    # Only force a flush when someone is watching the terminal
+    flush = sys.stdout.isatty()
+
     print("\n" + "=" * 70)
     print("🎨 Welcome to the Custom Tool Demo!")
     print("=" * 70)
@@ -240,7 +251,7 @@ def main():
     print("─" * 70)
     query = "What's the weather in San Francisco?"
     print(f"\n💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
@@ -252,7 +263,7 @@ def main():
     print("─" * 70)
     query = "Roll 3 six-sided dice for me"
     print(f"\n💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
@@ -264,7 +275,7 @@ def main():
     print("─" * 70)
     query = "Roll 2 twenty-sided dice"
     print(f"\n💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
@@ -276,7 +287,7 @@ def main():
     print("─" * 70)
     query = "Analyze this text: 'The quick brown fox jumps over the lazy dog'"
     print(f"\n💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
@@ -288,7 +299,7 @@ def main():
     print("─" * 70)
     query = "Check the weather in New York and then roll a die"
     print(f"\n💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
@@ -6,33 +6,46 @@ This example demonstrates how to wrap Python functions as tools that
 can be called by the agent.
 """
 
+import argparse
 import datetime
+import operator
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Literal
 
-from acton_agent import Agent, FunctionTool
+from pydantic import Field
+
+from acton_agent import Agent, FunctionTool, ToolInputSchema
 from acton_agent.client import OpenAIClient
 
 
+_OPERATIONS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+
+
 def calculate(a: float, b: float, operation: str) -> float:
     """Perform basic arithmetic operations."""
-    if operation == "add":
-        return a + b
-    if operation == "subtract":
-        return a - b
-    if operation == "multiply":
-        return a * b
-    if operation == "divide":
-        if b == 0:
-            raise ValueError("Cannot divide by zero")
-        return a / b
-    raise ValueError(f"Unknown operation: {operation}")
+    try:
+        op = _OPERATIONS[operation]
+    except KeyError:
+        raise ValueError(f"Unknown operation: {operation}") from None
+    try:
+        return op(a, b)
+    except ZeroDivisionError:
+        raise ValueError("Cannot divide by zero") from None
 
 
 def get_current_time(timezone: str = "UTC") -> str:
     """Get the current time. For simplicity, only supports UTC."""
+    now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
     if timezone != "UTC":
-        return f"Only UTC timezone is supported. Current time in UTC: {datetime.datetime.utcnow().isoformat()}"
-    return datetime.datetime.utcnow().isoformat()
+        return f"Only UTC timezone is supported. Current time in UTC: {now_iso}"
+    return now_iso
 
 
 def word_count(text: str) -> int:
@@ -45,103 +58,127 @@ def reverse_string(text: str) -> str:
     return text[::-1]
 
 
-def main():
-    # Initialize the OpenAI client
-    """
-    Run an interactive demo that wraps several Python functions as callable tools for an agent.
+# Input schemas for the demo tools
 
-    Sets up an OpenAI client from the OPENAI_API_KEY environment variable, constructs an Agent, registers four FunctionTools (calculator, get_time, count_words, reverse_text), and walks the user through a sequence of example queries demonstrating each tool and combined usage. If OPENAI_API_KEY is not set, prints an error message and exits early.
-    """
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        print("Error: Please set OPENAI_API_KEY environment variable")
-        return
 
-    client = OpenAIClient(api_key=api_key, model="gpt-4o")
+class CalculatorInput(ToolInputSchema):
+    a: float = Field(..., description="First number")
+    b: float = Field(..., description="Second number")
+    operation: Literal["add", "subtract", "multiply", "divide"] = Field(..., description="Operation to perform")
 
-    # Create an agent
-    agent = Agent(
-        llm_client=client,
-        system_prompt="You are a helpful assistant with various utility functions available.",
-    )
 
-    # Create FunctionTools with their schemas
-
-    # Calculator tool
-    calculator_schema = {
-        "type": "object",
-        "properties": {
-            "a": {"type": "number", "description": "First number"},
-            "b": {"type": "number", "description": "Second number"},
-            "operation": {
-                "type": "string",
-                "description": "Operation to perform",
-                "enum": ["add", "subtract", "multiply", "divide"],
-            },
-        },
-        "required": ["a", "b", "operation"],
-    }
-
-    calculator_tool = FunctionTool(
+class TimeInput(ToolInputSchema):
+    timezone: str = Field(default="UTC", description="Timezone for the time (only UTC supported)")
+
+
+class WordCountInput(ToolInputSchema):
+    text: str = Field(..., description="The text to count words in")
+
+
+class ReverseInput(ToolInputSchema):
+    text: str = Field(..., description="The text to reverse")
+
+
+# The tools hold no per-agent state, so every agent registers the same instances
+
+DEMO_TOOLS = (
+    FunctionTool(
         name="calculator",
         description="Perform basic arithmetic operations (add, subtract, multiply, divide)",
         func=calculate,
-        schema=calculator_schema,
-    )
-
-    # Time tool
-    time_schema = {
-        "type": "object",
-        "properties": {
-            "timezone": {
-                "type": "string",
-                "description": "Timezone for the time (only UTC supported)",
-                "default": "UTC",
-            }
-        },
-        "required": [],
-    }
-
-    time_tool = FunctionTool(
+        input_schema=CalculatorInput,
+    ),
+    FunctionTool(
         name="get_time",
         description="Get the current time in UTC",
         func=get_current_time,
-        schema=time_schema,
-    )
-
-    # Word count tool
-    word_count_schema = {
-        "type": "object",
-        "properties": {"text": {"type": "string", "description": "The text to count words in"}},
-        "required": ["text"],
-    }
-
-    word_count_tool = FunctionTool(
+        input_schema=TimeInput,
+    ),
+    FunctionTool(
         name="count_words",
         description="Count the number of words in a text string",
         func=word_count,
-        schema=word_count_schema,
-    )
-
-    # String reverse tool
-    reverse_schema = {
-        "type": "object",
-        "properties": {"text": {"type": "string", "description": "The text to reverse"}},
-        "required": ["text"],
-    }
-
-    reverse_tool = FunctionTool(
+        input_schema=WordCountInput,
+    ),
+    FunctionTool(
         name="reverse_text",
         description="Reverse a string",
         func=reverse_string,
-        schema=reverse_schema,
+        input_schema=ReverseInput,
+    ),
+)
+
+DEMO_QUERIES = (
+    "What is 25 multiplied by 4?",
+    "Calculate 100 divided by 5, then add 10 to the result",
+    "What time is it now?",
+    "How many words are in 'The quick brown fox jumps over the lazy dog'?",
+    "Reverse the string 'Hello World'",
+    "Reverse 'Python' and count how many words in the result",
+)
+
+
+def create_agent(client: OpenAIClient) -> Agent:
+    """
+    Build an Agent with the calculator, get_time, count_words, and reverse_text FunctionTools registered.
+    """
+    agent = Agent(
+        llm_client=client,
+        system_prompt="You are a helpful assistant with various utility functions available.",
     )
 
-    # Register all tools
-    agent.register_tool(calculator_tool)
-    agent.register_tool(time_tool)
-    agent.register_tool(word_count_tool)
-    agent.register_tool(reverse_tool)
+    # Register the shared demo tools
+    for tool in DEMO_TOOLS:
+        agent.register_tool(tool)
+
+    return agent
+
+
+def run_demo_batch(client: OpenAIClient, queries: tuple[str, ...] = DEMO_QUERIES, max_inflight: int = 6) -> None:
+    """
+    Run the demo queries concurrently without prompts, printing each answer as soon as it arrives.
+
+    Each query gets its own Agent so conversation histories stay independent. A query that fails is reported
+    in place of its answer without affecting the others.
+    """
+    with ThreadPoolExecutor(max_workers=max_inflight) as executor:
+        futures = {executor.submit(create_agent(client).run, query): query for query in queries}
+        for future in as_completed(futures):
+            print(f"\n💬 You: {futures[future]}")
+            try:
+                answer = future.result()
+            except Exception as e:
+                print(f"⚠️  Error: {e}")
+            else:
+                print(f"🤖 Agent: {answer}")
+
+
+def main():
+    # Initialize the OpenAI client
+    """
+    Run an interactive demo that wraps several Python functions as callable tools for an agent.
+
+    Sets up an OpenAI client from the OPENAI_API_KEY environment variable, constructs an Agent, registers four FunctionTools (calculator, get_time, count_words, reverse_text), and walks the user through a sequence of example queries demonstrating each tool and combined usage. With --batch, the queries are run concurrently without prompts instead. If OPENAI_API_KEY is not set, prints an error message and exits early.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch", action="store_true", help="run all demo queries concurrently without prompts")
+    args = parser.parse_args()
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        print("Error: Please set OPENAI_API_KEY environment variable")
+        return
+
+    client = OpenAIClient(api_key=api_key, model="gpt-4o")
+
+    if args.batch:
+        run_demo_batch(client)
+        return
+
+    agent = create_agent(client)
+
+    # Only force a flush when someone is watching the terminal
+    flush = sys.stdout.isatty()
 
     print("\n" + "=" * 70)
     print("🛠️  Welcome to the Function Tool Demo!")
@@ -157,7 +194,7 @@ def main():
     print("─" * 70)
     query = "What is 25 multiplied by 4?"
     print(f"\n💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
@@ -169,7 +206,7 @@ def main():
     print("─" * 70)
     query = "Calculate 100 divided by 5, then add 10 to the result"
     print(f"\n💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
@@ -181,7 +218,7 @@ def main():
     print("─" * 70)
     query = "What time is it now?"
     print(f"\n💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
@@ -193,7 +230,7 @@ def main():
     print("─" * 70)
     query = "How many words are in 'The quick brown fox jumps over the lazy dog'?"
     print(f"\n💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
@@ -205,7 +242,7 @@ def main():
     print("─" * 70)
     query = "Reverse the string 'Hello World'"
     print(f"\n💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
@@ -217,7 +254,7 @@ def main():
     print("─" * 70)
     query = "Reverse 'Python' and count how many words in the result"
     print(f"\n💬 You: {query}\n")
-    print("🤖 Agent: ", end="", flush=True)
+    print("🤖 Agent: ", end="", flush=flush)
     result = agent.run(query)
     print(result)
     print()
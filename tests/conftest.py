@@ -2,33 +2,125 @@
 Test configuration and fixtures for pytest.
 """
 
+import asyncio
+import io
+import json
+from collections import deque
+
 import pytest
 
 from acton_agent.agent.models import Message
 
 
+# Canned messages and LLM outputs shared by the fixtures below; built once at import
+
+_SAMPLE_MESSAGES = (
+    Message(role="system", content="You are a helpful assistant"),
+    Message(role="user", content="Hello"),
+    Message(role="assistant", content="Hi there!"),
+)
+
+_TOOL_CALL_RESPONSE = """```json
+{
+  "thought": "I need to calculate the sum",
+  "tool_calls": [
+    {
+      "id": "call_1",
+      "tool_name": "calculator",
+      "parameters": {"a": 5, "b": 3}
+    }
+  ]
+}
+```"""
+
+_FINAL_ANSWER_RESPONSE = """```json
+{
+  "thought": "I have completed the calculation",
+  "final_answer": "The sum is 8"
+}
+```"""
+
+_PLAN_RESPONSE = """```json
+{
+  "thought": "Let me plan how to solve this",
+  "plan": [
+    "First, I will search for information",
+    "Then, I will analyze the results",
+    "Finally, I will provide the answer"
+  ]
+}
+```"""
+
+
+def _parse_fenced_json(response: str) -> dict:
+    """Strip the ```json fence from a canned response and parse its body."""
+    return json.loads(response.split("```json", 1)[1].rsplit("```", 1)[0])
+
+
+_DEFAULT_RESPONSE = '```json\n{"final_answer": "Mock response"}\n```'
+
+_TOOL_CALL_PARSED = _parse_fenced_json(_TOOL_CALL_RESPONSE)
+_FINAL_ANSWER_PARSED = _parse_fenced_json(_FINAL_ANSWER_RESPONSE)
+_PLAN_PARSED = _parse_fenced_json(_PLAN_RESPONSE)
+
+
 class MockLLMClient:
     """Mock LLM client for testing."""
 
-    def __init__(self, responses: list[str] | None = None):
+    def __init__(
+        self,
+        responses: list[str] | None = None,
+        chunk_size: int = 32,
+        memoize: bool = False,
+        max_calls_recorded: int | None = None,
+    ):
         """
         Create a MockLLMClient configured with an optional sequence of preset responses.
 
         Parameters:
             responses (List[str], optional): Ordered list of response strings to return for successive `call`/`call_stream` invocations. If omitted or exhausted, the client will produce a default mock response when called.
+            chunk_size (int): Number of characters per chunk yielded by `call_stream`, mimicking the multi-character deltas of real streaming APIs.
+            memoize (bool): If True, a call with the same messages and keyword arguments as an earlier call returns that call's response without consuming another preset response.
+            max_calls_recorded (int | None): Keep only the most recent N entries in `calls`; None keeps every call.
 
         Notes:
-            Initializes `call_count` to 0 and `calls` to an empty list to record invocation history for tests.
+            Queues the responses, and initializes `call_count` to 0, `calls` to an empty log, and `stats` to zero memoization hits and misses.
         """
-        self.responses = responses or []
+        self._responses = deque(responses or ())
+        self.chunk_size = chunk_size
         self.call_count = 0
-        self.calls = []  # Store all calls for inspection
+        self.calls = deque(maxlen=max_calls_recorded)  # Store calls for inspection
+        self.memoize = memoize
+        self._memo: dict[str, str] = {}
+        self.stats = {"hits": 0, "misses": 0}
+
+    def queue_responses(self, *responses: str) -> None:
+        """
+        Append responses to the end of the preset response queue, e.g. partway through a test.
+
+        Parameters:
+            *responses (str): Response strings returned, in order, after any already queued.
+        """
+        self._responses.extend(responses)
+
+    def reset(self) -> None:
+        """
+        Return the client to its freshly constructed state so one instance can be reused across tests.
+
+        Clears the call log, preset responses, call counter, memo, and memoization stats in place. Configuration passed to the constructor (chunk_size, memoize, max_calls_recorded) is kept.
+        """
+        self._responses.clear()
+        self.call_count = 0
+        self.calls.clear()
+        self._memo.clear()
+        self.stats["hits"] = 0
+        self.stats["misses"] = 0
 
     def call(self, messages: list[Message], **kwargs) -> str:
         """
         Record the invocation and return the next mock response.
 
-        Appends a record with the provided messages and keyword arguments to the client's internal call log. If a predefined response is available it is returned (and the internal call counter is advanced); otherwise a default JSON-formatted final answer wrapped in a code fence is returned.
+        Appends a record with the provided messages and keyword arguments to the client's internal call log. If a predefined response is available it is returned (and the internal call counter is advanced); otherwise a default JSON-formatted final answer wrapped in a code fence is returned. With `memoize` enabled, a repeated call is answered from the memo and counted in `stats`.
 
         Parameters:
             messages (List[Message]): Messages sent to the mock client; recorded for inspection.
@@ -38,41 +130,150 @@ class MockLLMClient:
             str: The next predefined response string if available, otherwise a default JSON code-fenced final answer.
         """
         self.calls.append({"messages": messages, "kwargs": kwargs})
+        return self._next_response(messages, kwargs)
 
-        if self.call_count < len(self.responses):
-            response = self.responses[self.call_count]
+    def call_batch(self, batch: list[list[Message]], **kwargs) -> list[str]:
+        """
+        Record and answer several independent calls at once, as a parallel-agent test would issue them.
+
+        Parameters:
+            batch (List[List[Message]]): One message list per call; each is recorded as its own entry in the call log.
+            **kwargs: Additional call options shared by every call; recorded for inspection.
+
+        Returns:
+            List[str]: One response per message list, in order, drawn exactly as successive `call` invocations would.
+        """
+        self.calls.extend({"messages": messages, "kwargs": kwargs} for messages in batch)
+        return [self._next_response(messages, kwargs) for messages in batch]
+
+    async def acall_batch(self, batch: list[list[Message]], **kwargs) -> list[str]:
+        """
+        Async counterpart of `call_batch` that issues the calls concurrently via `acall`.
+
+        Parameters:
+            batch (List[List[Message]]): One message list per call.
+            **kwargs: Additional call options shared by every call.
+
+        Returns:
+            List[str]: One response per message list, in order.
+        """
+        return await asyncio.gather(*(self.acall(messages, **kwargs) for messages in batch))
+
+    def _next_response(self, messages: list[Message], kwargs: dict) -> str:
+        """
+        Produce the response for one already-recorded call, consulting the memo when memoization is enabled.
+
+        Parameters:
+            messages (List[Message]): Messages of the call being answered.
+            kwargs (dict): Keyword arguments of the call being answered.
+
+        Returns:
+            str: The memoized, next preset, or default response.
+        """
+        key = None
+        if self.memoize:
+            key = json.dumps(
+                {"messages": [[m.role, m.content] for m in messages], "kwargs": kwargs}, sort_keys=True, default=str
+            )
+            if key in self._memo:
+                self.stats["hits"] += 1
+                return self._memo[key]
+            self.stats["misses"] += 1
+
+        try:
+            response = self._responses.popleft()
             self.call_count += 1
-            return response
+        except IndexError:
+            # Default response if no more predefined responses
+            response = _DEFAULT_RESPONSE
 
-        # Default response if no more predefined responses
-        return '```json\n{"final_answer": "Mock response"}\n```'
+        if key is not None:
+            self._memo[key] = response
+        return response
 
     def call_stream(self, messages: list[Message], **kwargs):
         """
-        Stream the client's response one character at a time.
+        Stream the client's response in chunks of `chunk_size` characters.
 
         Parameters:
             messages (List[Message]): Message sequence sent to the client; used to produce the mock response.
 
         Returns:
-            iterator: Yields each character of the response as a one-character string.
+            iterator: Yields consecutive slices of the response, each at most `chunk_size` characters long.
         """
-        response = self.call(messages, **kwargs)
-        # Yield character by character
-        yield from response
+        yield from self._chunks(self.call(messages, **kwargs))
 
+    async def acall(self, messages: list[Message], **kwargs) -> str:
+        """
+        Async counterpart of `call`, for code under test that awaits its LLM client.
 
-@pytest.fixture
-def mock_llm_client():
+        Shares the response queue and call log with `call`.
+
+        Parameters:
+            messages (List[Message]): Messages sent to the mock client; recorded for inspection.
+            **kwargs: Additional call options; recorded for inspection.
+
+        Returns:
+            str: The next predefined response string if available, otherwise a default JSON code-fenced final answer.
+        """
+        return self.call(messages, **kwargs)
+
+    async def acall_stream(self, messages: list[Message], **kwargs):
+        """
+        Async counterpart of `call_stream`, yielding the response in chunks of `chunk_size` characters.
+
+        Control is handed back to the event loop between chunks so concurrent streams interleave as they would against a real API.
+
+        Parameters:
+            messages (List[Message]): Message sequence sent to the client; used to produce the mock response.
+
+        Returns:
+            async iterator: Yields consecutive slices of the response, each at most `chunk_size` characters long.
+        """
+        for chunk in self._chunks(self.call(messages, **kwargs)):
+            yield chunk
+            await asyncio.sleep(0)
+
+    def _chunks(self, response: str):
+        """
+        Split a response into consecutive pieces of at most `chunk_size` characters.
+
+        Parameters:
+            response (str): The full response text.
+
+        Returns:
+            iterator: Yields the pieces in order; their concatenation equals `response`.
+        """
+        buffer = io.StringIO(response)
+        while chunk := buffer.read(self.chunk_size):
+            yield chunk
+
+
+@pytest.fixture(scope="session")
+def _mock_llm_singleton():
     """
-    Create a MockLLMClient for tests that records invocations and can simulate streaming.
+    The single MockLLMClient instance shared by every test that requests `mock_llm_client`.
 
     Returns:
-        MockLLMClient: Mock LLM client initialized with no preset responses.
+        MockLLMClient: Mock LLM client created once per test session.
     """
     return MockLLMClient()
 
 
+@pytest.fixture
+def mock_llm_client(_mock_llm_singleton):
+    """
+    Provide the shared MockLLMClient, reset so each test starts with no responses and an empty call log.
+
+    Tests that need a differently configured client should construct their own MockLLMClient rather than changing the configuration of this shared instance.
+
+    Returns:
+        MockLLMClient: Mock LLM client with no preset responses.
+    """
+    _mock_llm_singleton.reset()
+    return _mock_llm_singleton
+
+
 @pytest.fixture
 def mock_llm_client_with_responses():
     """Fixture factory for mock LLM client with custom responses."""
@@ -100,16 +301,12 @@ def sample_messages():
     Provide a small sequence of Message objects representing a typical assistant interaction.
 
     Returns:
-        List[Message]: Three messages in order — a system prompt, a user message, and an assistant reply.
+        List[Message]: Three messages in order — a system prompt, a user message, and an assistant reply. The list is a fresh copy; the Message objects are shared.
     """
-    return [
-        Message(role="system", content="You are a helpful assistant"),
-        Message(role="user", content="Hello"),
-        Message(role="assistant", content="Hi there!"),
-    ]
+    return list(_SAMPLE_MESSAGES)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tool_call_response():
     """
     Provides a sample tool call response wrapped in a JSON code fence.
@@ -117,21 +314,21 @@ def tool_call_response():
     Returns:
         str: A string containing a JSON object with keys "thought" and "tool_calls" (an array of tool call entries), wrapped in a triple-backtick ```json``` fence.
     """
-    return """```json
-{
-  "thought": "I need to calculate the sum",
-  "tool_calls": [
-    {
-      "id": "call_1",
-      "tool_name": "calculator",
-      "parameters": {"a": 5, "b": 3}
-    }
-  ]
-}
-```"""
+    return _TOOL_CALL_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def tool_call_response_parsed():
+    """
+    The JSON body of `tool_call_response`, parsed once at import.
+
+    Returns:
+        dict: The decoded tool call payload. Shared across tests; do not mutate.
+    """
+    return _TOOL_CALL_PARSED
+
+
+@pytest.fixture(scope="session")
 def final_answer_response():
     """
     Sample LLM final-answer response formatted as a JSON code block.
@@ -139,15 +336,21 @@ def final_answer_response():
     Returns:
         str: A string containing a JSON object with keys `thought` and `final_answer`, wrapped in a ```json code fence.
     """
-    return """```json
-{
-  "thought": "I have completed the calculation",
-  "final_answer": "The sum is 8"
-}
-```"""
+    return _FINAL_ANSWER_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def final_answer_response_parsed():
+    """
+    The JSON body of `final_answer_response`, parsed once at import.
+
+    Returns:
+        dict: The decoded final answer payload. Shared across tests; do not mutate.
+    """
+    return _FINAL_ANSWER_PARSED
+
+
+@pytest.fixture(scope="session")
 def plan_response():
     """
     Provide a JSON-formatted plan containing a "thought" and a "plan" array wrapped in a Markdown ```json fenced code block.
@@ -155,16 +358,18 @@ def plan_response():
     Returns:
         str: The plan response as a string containing a JSON object with a "thought" field and a "plan" array, enclosed in triple-backtick ```json fences.
     """
-    return """```json
-{
-  "thought": "Let me plan how to solve this",
-  "plan": [
-    "First, I will search for information",
-    "Then, I will analyze the results",
-    "Finally, I will provide the answer"
-  ]
-}
-```"""
+    return _PLAN_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def plan_response_parsed():
+    """
+    The JSON body of `plan_response`, parsed once at import.
+
+    Returns:
+        dict: The decoded plan payload. Shared across tests; do not mutate.
+    """
+    return _PLAN_PARSED
 
 
 @pytest.fixture
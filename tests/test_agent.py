@@ -2,6 +2,9 @@
 Tests for the core Agent class.
 """
 
+import threading
+import time
+
 import pytest
 
 from acton_agent.agent.agent import Agent
@@ -319,6 +322,136 @@ class TestToolExecution:
         assert not results[0].success
         assert "Division by zero" in results[0].error
 
+    def test_execute_tool_calls_in_parallel(self, mock_llm_client):
+        """Test that parallel_tool_calls runs a step's tool calls concurrently and keeps their order."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_peer(value: str) -> str:
+            barrier.wait()
+            return value
+
+        agent = Agent(llm_client=mock_llm_client, parallel_tool_calls=True)
+        agent.register_tool(FunctionTool(name="wait", description="Wait for a peer call", func=wait_for_peer))
+
+        tool_calls = [
+            ToolCall(id="call_1", tool_name="wait", parameters={"value": "first"}),
+            ToolCall(id="call_2", tool_name="wait", parameters={"value": "second"}),
+        ]
+
+        results = agent._execute_tool_calls(tool_calls)
+        assert [r.tool_call_id for r in results] == ["call_1", "call_2"]
+        assert [r.result for r in results] == ["first", "second"]
+
+    def test_parallel_tool_calls_capped_by_max_tool_workers(self, mock_llm_client):
+        """Test that a step with many tool calls never runs more than max_tool_workers of them at once."""
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def track(value: str) -> str:
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return value
+
+        agent = Agent(llm_client=mock_llm_client, parallel_tool_calls=True, max_tool_workers=2)
+        agent.register_tool(FunctionTool(name="track", description="Track concurrency", func=track))
+
+        tool_calls = [ToolCall(id=f"call_{i}", tool_name="track", parameters={"value": str(i)}) for i in range(6)]
+
+        results = agent._execute_tool_calls(tool_calls)
+        assert [r.result for r in results] == [str(i) for i in range(6)]
+        assert peak[0] <= 2
+
+    @pytest.mark.parametrize("max_tool_workers", [0, -1])
+    def test_invalid_max_tool_workers_rejected(self, mock_llm_client, max_tool_workers):
+        """Test that a non-positive max_tool_workers is rejected when the agent is created."""
+        with pytest.raises(ValueError, match="max_tool_workers"):
+            Agent(llm_client=mock_llm_client, parallel_tool_calls=True, max_tool_workers=max_tool_workers)
+
+    def test_execute_tool_calls_stream_in_parallel(self, mock_llm_client):
+        """Test that parallel streaming execution emits all start events, then results in request order."""
+        agent = Agent(llm_client=mock_llm_client, parallel_tool_calls=True)
+        agent.register_tool(SimpleCalculatorTool())
+
+        tool_calls = [
+            ToolCall(id="call_1", tool_name="calculator", parameters={"a": 2, "b": 3}),
+            ToolCall(id="call_2", tool_name="missing", parameters={}),
+        ]
+
+        events = list(agent._execute_tool_calls_stream(tool_calls, step_id="step_1"))
+        assert [(e.tool_call_id, e.status) for e in events] == [
+            ("call_1", "started"),
+            ("call_2", "started"),
+            ("call_1", "completed"),
+            ("call_2", "failed"),
+        ]
+        assert events[2].result.result == "5"
+
+    def test_cache_tool_results_reuses_identical_calls(self, mock_llm_client):
+        """Test that cache_tool_results executes a repeated call with the same parameters only once."""
+        calls = []
+
+        def lookup(key: str, page: int = 1) -> str:
+            calls.append((key, page))
+            return f"{key}:{page}"
+
+        agent = Agent(llm_client=mock_llm_client, cache_tool_results=True)
+        agent.register_tool(FunctionTool(name="lookup", description="Look up a key", func=lookup))
+
+        results = agent._execute_tool_calls(
+            [
+                ToolCall(id="call_1", tool_name="lookup", parameters={"key": "a", "page": 2}),
+                ToolCall(id="call_2", tool_name="lookup", parameters={"page": 2, "key": "a"}),
+                ToolCall(id="call_3", tool_name="lookup", parameters={"key": "b"}),
+            ]
+        )
+
+        assert calls == [("a", 2), ("b", 1)]
+        assert [r.tool_call_id for r in results] == ["call_1", "call_2", "call_3"]
+        assert [r.result for r in results] == ["a:2", "a:2", "b:1"]
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_parallel_identical_calls_execute_once(self, mock_llm_client, stream):
+        """Test that identical calls in one parallel step run once and share the result."""
+        lock = threading.Lock()
+        calls = []
+
+        def lookup(key: str) -> str:
+            with lock:
+                calls.append(key)
+            time.sleep(0.01)
+            return f"value:{key}"
+
+        agent = Agent(llm_client=mock_llm_client, parallel_tool_calls=True, cache_tool_results=True)
+        agent.register_tool(FunctionTool(name="lookup", description="Look up a key", func=lookup))
+
+        tool_calls = [ToolCall(id=f"call_{i}", tool_name="lookup", parameters={"key": "a"}) for i in range(4)]
+        tool_calls.append(ToolCall(id="call_4", tool_name="lookup", parameters={"key": "b"}))
+
+        if stream:
+            events = list(agent._execute_tool_calls_stream(tool_calls, step_id="step_1"))
+            results = [e.result for e in events if e.status == "completed"]
+        else:
+            results = agent._execute_tool_calls(tool_calls)
+
+        assert sorted(calls) == ["a", "b"]
+        assert [r.tool_call_id for r in results] == [f"call_{i}" for i in range(5)]
+        assert [r.result for r in results] == ["value:a"] * 4 + ["value:b"]
+
+    def test_cache_tool_results_skips_errors(self, mock_llm_client):
+        """Test that failed tool results are not cached."""
+        agent = Agent(llm_client=mock_llm_client, cache_tool_results=True)
+        agent.register_tool(SimpleCalculatorTool())
+
+        tool_call = ToolCall(id="call_1", tool_name="calculator", parameters={"a": 1, "b": 0, "operation": "divide"})
+        agent._execute_tool_calls([tool_call])
+
+        assert agent._tool_result_cache == {}
+
 
 class TestConversationHistory:
     """Tests for conversation history management."""
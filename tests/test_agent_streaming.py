@@ -179,6 +179,7 @@ class TestAgentStreamingEvents:
 
         token_events = [e for e in events if isinstance(e, AgentToken)]
         assert len(token_events) > 0
+        assert "".join(e.content for e in token_events) == response
 
         stream_end_events = [e for e in events if isinstance(e, AgentStreamEnd)]
         assert len(stream_end_events) == 1
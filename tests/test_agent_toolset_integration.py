@@ -172,3 +172,15 @@ def test_agent_register_toolset_and_individual_tools(mock_llm_client, sample_too
     assert "sample_toolset" in system_message.content
     assert "Standalone Tools" in system_message.content
     assert "standalone" in system_message.content
+
+
+def test_system_message_keeps_tool_listing_before_datetime(mock_llm_client, sample_toolset):
+    """Test that the per-turn date and time come after the stable system prompt and tool listing."""
+    agent = Agent(llm_client=mock_llm_client)
+    agent.register_toolset(sample_toolset)
+
+    content = agent._build_messages()[0].content
+    tools_text = agent.tool_registry.format_for_prompt()
+
+    assert content.startswith(f"{agent.system_prompt}\n\n{tools_text}")
+    assert content.index(tools_text) < content.index("Current Date and Time:")
@@ -0,0 +1,39 @@
+"""
+Construction benchmarks for the core models.
+
+Skipped unless pytest-benchmark is installed. pytest-benchmark disables timing under pytest-xdist, so
+timings are only recorded by a serial run such as ``pytest tests/test_benchmarks.py --benchmark-only``,
+which CI runs as its own step.
+"""
+
+import pytest
+
+from acton_agent.agent.models import AgentStep, Message
+from acton_agent.tools import ToolCall
+
+
+pytest.importorskip("pytest_benchmark")
+
+_ADD_PARAMS = {"a": 1, "b": 2}
+_TOOL_CALL_DATA = {"id": "call_1", "tool_name": "calculator", "parameters": _ADD_PARAMS}
+_TOOL_CALL = ToolCall(**_TOOL_CALL_DATA)
+
+
+@pytest.mark.benchmark(group="models")
+class TestModelConstructionBenchmarks:
+    """Benchmarks for validated model construction."""
+
+    def test_bench_message_init(self, benchmark):
+        """Benchmark constructing a Message."""
+        msg = benchmark(Message, role="user", content="Hello")
+        assert msg.role == "user"
+
+    def test_bench_tool_call_init(self, benchmark):
+        """Benchmark constructing a ToolCall."""
+        tool_call = benchmark(ToolCall, **_TOOL_CALL_DATA)
+        assert tool_call.parameters == _ADD_PARAMS
+
+    def test_bench_agent_step_init(self, benchmark):
+        """Benchmark constructing an AgentStep holding three tool calls."""
+        step = benchmark(AgentStep, tool_thought="Calling tools", tool_calls=[_TOOL_CALL] * 3)
+        assert len(step.tool_calls) == 3
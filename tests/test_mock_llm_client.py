@@ -0,0 +1,95 @@
+"""
+Tests for the MockLLMClient test double defined in conftest.
+"""
+
+import asyncio
+
+from acton_agent.agent.models import Message
+
+from .conftest import MockLLMClient
+
+
+class TestMockLLMClientAsync:
+    """Tests for the async interface of MockLLMClient."""
+
+    def test_acall_returns_responses_in_order(self, mock_llm_client_with_responses):
+        """Test that acall shares the response queue and call log with call."""
+        client = mock_llm_client_with_responses(["first", "second"])
+        messages = [Message(role="user", content="Hi")]
+
+        async def _run():
+            return [await client.acall(messages), client.call(messages), await client.acall(messages)]
+
+        assert asyncio.run(_run()) == ["first", "second", '```json\n{"final_answer": "Mock response"}\n```']
+        assert len(client.calls) == 3
+
+    def test_acall_stream_yields_chunks(self, mock_streaming_llm_client):
+        """Test that acall_stream yields the response in chunk_size pieces."""
+        client = mock_streaming_llm_client(["abcdefgh"])
+        client.chunk_size = 3
+
+        async def _collect():
+            return [chunk async for chunk in client.acall_stream([])]
+
+        assert asyncio.run(_collect()) == ["abc", "def", "gh"]
+
+    def test_acall_batch_returns_responses_in_order(self, mock_llm_client_with_responses):
+        """Test that acall_batch answers every call in batch order."""
+        client = mock_llm_client_with_responses(["first", "second"])
+        batch = [[Message(role="user", content="a")], [Message(role="user", content="b")]]
+
+        assert asyncio.run(client.acall_batch(batch)) == ["first", "second"]
+        assert len(client.calls) == 2
+
+
+class TestMockLLMClientRecording:
+    """Tests for call memoization and the bounded call log."""
+
+    def test_memoize_reuses_response_for_identical_calls(self):
+        """Test that a repeated call is answered from the memo without consuming a response."""
+        client = MockLLMClient(responses=["first", "second"], memoize=True)
+        hello = [Message(role="user", content="Hello")]
+        bye = [Message(role="user", content="Bye")]
+
+        assert client.call(hello) == "first"
+        assert client.call(hello) == "first"
+        assert client.call(bye) == "second"
+        assert client.stats == {"hits": 1, "misses": 2}
+
+    def test_max_calls_recorded_keeps_most_recent(self):
+        """Test that the call log is capped at max_calls_recorded entries."""
+        client = MockLLMClient(max_calls_recorded=2)
+        for content in ["a", "b", "c"]:
+            client.call([Message(role="user", content=content)])
+
+        assert [c["messages"][0].content for c in client.calls] == ["b", "c"]
+
+    def test_reset_restores_fresh_state(self):
+        """Test that reset clears recorded calls, responses, and memo while keeping configuration."""
+        client = MockLLMClient(responses=["first"], chunk_size=4, memoize=True)
+        client.call([Message(role="user", content="Hello")])
+        client.call([Message(role="user", content="Hello")])
+
+        client.reset()
+
+        assert len(client.calls) == 0
+        assert client.call_count == 0
+        assert client.stats == {"hits": 0, "misses": 0}
+        assert client.chunk_size == 4
+        assert client.call([Message(role="user", content="Hello")]) == '```json\n{"final_answer": "Mock response"}\n```'
+
+    def test_queue_responses_appends_after_pending(self):
+        """Test that responses queued mid-test are returned after the pending ones."""
+        client = MockLLMClient(responses=["first"])
+        client.queue_responses("second", "third")
+
+        assert [client.call([]) for _ in range(3)] == ["first", "second", "third"]
+        assert client.call_count == 3
+
+    def test_call_batch_records_each_call(self):
+        """Test that call_batch records one log entry per call and draws responses in order."""
+        client = MockLLMClient(responses=["first", "second"])
+        batch = [[Message(role="user", content="a")], [Message(role="user", content="b")]]
+
+        assert client.call_batch(batch, temperature=0) == ["first", "second"]
+        assert [c["kwargs"] for c in client.calls] == [{"temperature": 0}, {"temperature": 0}]
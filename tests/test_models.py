@@ -3,7 +3,7 @@ Tests for the models module.
 """
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from acton_agent.agent.models import (
     AgentFinalResponse,
@@ -21,36 +21,129 @@ from acton_agent.agent.models import (
 from acton_agent.tools import ToolCall, ToolResult
 
 
+INVALID_CASES = [
+    (Message, {"role": "invalid", "content": "Test"}),
+    (Message, {"role": "user"}),
+    (ToolCall, {"tool_name": "calculator"}),
+    (ToolCall, {"id": "call_123"}),
+    (ToolResult, {"tool_call_id": "call_123", "tool_name": "calculator"}),
+    (AgentStep, {"tool_calls": "not a list"}),
+    (AgentToken, {"content": "test"}),
+]
+
+_ADD_PARAMS = {"a": 1, "b": 2}
+
+_PLAN = AgentPlan(plan="step1")
+_DUMMY_TOOL_CALL = ToolCall(id="1", tool_name="test")
+_DUMMY_STEP = AgentStep(tool_thought="test", tool_calls=[_DUMMY_TOOL_CALL])
+_FINAL = AgentFinalResponse(final_answer="done")
+
+STREAMING_EVENTS = [
+    (lambda: AgentStreamStart(step_id="step-1"), "stream_start"),
+    (lambda: AgentStreamEnd(step_id="step-1"), "stream_end"),
+    (lambda: AgentPlanEvent(step_id="step-1", plan=_PLAN), "agent_plan"),
+    (lambda: AgentStepEvent(step_id="step-1", step=_DUMMY_STEP), "agent_step"),
+    (lambda: AgentFinalResponseEvent(step_id="step-1", response=_FINAL), "final_response"),
+]
+
+_HAPPY_CASES = {
+    Message: [{"role": role, "content": "Test"} for role in ("user", "assistant", "system")],
+    ToolCall: [
+        {"id": "call_123", "tool_name": "calculator", "parameters": _ADD_PARAMS},
+        {"id": "call_123", "tool_name": "get_time"},
+    ],
+    ToolResult: [
+        {"tool_call_id": "call_123", "tool_name": "calculator", "result": "42"},
+        {"tool_call_id": "call_123", "tool_name": "calculator", "result": "", "error": "Division by zero"},
+    ],
+    AgentPlan: [{"plan": "Step 1\nStep 2\nStep 3"}, {"plan": ""}],
+    AgentStep: [
+        {"tool_thought": "I need to call a tool", "tool_calls": [{"id": "call_1", "tool_name": "test"}]},
+        {"tool_thought": "Thinking", "tool_calls": []},
+    ],
+    AgentFinalResponse: [{"final_answer": "The answer is 42"}],
+}
+_HAPPY_ADAPTERS = {cls: TypeAdapter(list[cls]) for cls in _HAPPY_CASES}
+
+_EXPECTED_MESSAGE_JSON = '{"role":"user","content":"Hello"}'
+_EXPECTED_TOOL_CALL_JSON = '{"id":"call_123","tool_name":"calculator","parameters":{"a":1,"b":2}}'
+_EXPECTED_TOOL_RESULT_JSON = '{"tool_call_id":"call_123","tool_name":"calculator","result":"42","error":null}'
+_EXPECTED_STEP_JSON = (
+    '{"tool_thought":"I need to call a tool","tool_calls":[{"id":"call_1","tool_name":"test","parameters":{}}]}'
+)
+_EXPECTED_FINAL_RESPONSE_JSON = '{"final_answer":"The answer is 42"}'
+
+
+@pytest.fixture(scope="session")
+def user_message():
+    """Shared user message; treat as read-only."""
+    return Message(role="user", content="Hello")
+
+
+@pytest.fixture(scope="session")
+def calculator_tool_call():
+    """Shared calculator tool call; treat as read-only."""
+    return ToolCall(id="call_123", tool_name="calculator", parameters=_ADD_PARAMS)
+
+
+@pytest.fixture(scope="session")
+def successful_tool_result():
+    """Shared successful tool result; treat as read-only."""
+    return ToolResult(tool_call_id="call_123", tool_name="calculator", result="42", error=None)
+
+
+@pytest.fixture(scope="session")
+def final_response():
+    """Shared final response; treat as read-only."""
+    return AgentFinalResponse(final_answer="The answer is 42")
+
+
 class TestMessage:
     """Tests for Message model."""
 
-    def test_create_message(self):
+    def test_create_message(self, user_message):
         """Test creating a valid message."""
-        msg = Message(role="user", content="Hello")
-        assert msg.role == "user"
-        assert msg.content == "Hello"
+        assert user_message.model_dump_json() == _EXPECTED_MESSAGE_JSON
 
-    def test_message_roles(self):
+    @pytest.mark.parametrize("role", ["user", "assistant", "system"])
+    def test_message_roles(self, role):
         """Test all valid message roles."""
-        for role in ["user", "assistant", "system"]:
-            msg = Message(role=role, content="Test")
-            assert msg.role == role
+        msg = Message(role=role, content="Test")
+        assert msg.role == role
+
+
+class TestModelValidation:
+    """Tests for rejected model inputs."""
 
-    def test_invalid_role(self):
-        """Test that invalid role raises error."""
+    @pytest.mark.parametrize(
+        ("cls", "kwargs"),
+        INVALID_CASES,
+        ids=[f"{cls.__name__}-{'-'.join(kwargs)}" for cls, kwargs in INVALID_CASES],
+    )
+    def test_invalid_input_raises(self, cls, kwargs):
+        """Test that invalid or incomplete input raises a validation error."""
         with pytest.raises(ValidationError):
-            Message(role="invalid", content="Test")
+            cls(**kwargs)
+
+
+class TestBulkValidation:
+    """Tests for validating many valid inputs in one pass."""
+
+    @pytest.mark.parametrize("cls", list(_HAPPY_CASES), ids=lambda cls: cls.__name__)
+    def test_bulk_valid_construction(self, cls):
+        """Test that list validation matches constructing each model individually."""
+        cases = _HAPPY_CASES[cls]
+        models = _HAPPY_ADAPTERS[cls].validate_python(cases)
+        assert len(models) == len(cases)
+        assert models == [cls(**case) for case in cases]
 
 
 class TestToolCall:
     """Tests for ToolCall model."""
 
-    def test_create_tool_call(self):
+    def test_create_tool_call(self, calculator_tool_call):
         """Test creating a tool call."""
-        tool_call = ToolCall(id="call_123", tool_name="calculator", parameters={"a": 1, "b": 2})
-        assert tool_call.id == "call_123"
-        assert tool_call.tool_name == "calculator"
-        assert tool_call.parameters == {"a": 1, "b": 2}
+        assert calculator_tool_call.model_dump_json() == _EXPECTED_TOOL_CALL_JSON
 
     def test_tool_call_with_empty_parameters(self):
         """Test tool call with no parameters."""
@@ -61,12 +154,10 @@ class TestToolCall:
 class TestToolResult:
     """Tests for ToolResult model."""
 
-    def test_successful_tool_result(self):
+    def test_successful_tool_result(self, successful_tool_result):
         """Test creating a successful tool result."""
-        result = ToolResult(tool_call_id="call_123", tool_name="calculator", result="42", error=None)
-        assert result.success
-        assert result.result == "42"
-        assert result.error is None
+        assert successful_tool_result.success
+        assert successful_tool_result.model_dump_json() == _EXPECTED_TOOL_RESULT_JSON
 
     def test_failed_tool_result(self):
         """Test creating a failed tool result."""
@@ -103,9 +194,8 @@ class TestAgentStep:
             tool_thought="I need to call a tool",
             tool_calls=[ToolCall(id="call_1", tool_name="test", parameters={})],
         )
-        assert step.tool_thought == "I need to call a tool"
         assert step.has_tool_calls
-        assert len(step.tool_calls) == 1
+        assert step.model_dump_json() == _EXPECTED_STEP_JSON
 
     def test_step_with_no_tool_calls(self):
         """Test step with empty tool calls."""
@@ -116,15 +206,13 @@ class TestAgentStep:
 class TestAgentFinalResponse:
     """Tests for AgentFinalResponse model."""
 
-    def test_create_final_response(self):
+    def test_create_final_response(self, final_response):
         """Test creating a final response."""
-        response = AgentFinalResponse(final_answer="The answer is 42")
-        assert response.final_answer == "The answer is 42"
+        assert final_response.model_dump_json() == _EXPECTED_FINAL_RESPONSE_JSON
 
-    def test_final_response_without_thought(self):
+    def test_final_response_without_thought(self, final_response):
         """Test final response creation."""
-        response = AgentFinalResponse(final_answer="The answer is 42")
-        assert response.final_answer == "The answer is 42"
+        assert final_response.final_answer == "The answer is 42"
 
 
 class TestStreamingModels:
@@ -132,32 +220,28 @@ class TestStreamingModels:
 
     def test_agent_token(self):
         """Test AgentToken model."""
-        token = AgentToken(step_id="test-step-id", content="test")
+        token = AgentToken.model_construct(step_id="test-step-id", content="test")
         assert token.type == "token"
         assert token.step_id == "test-step-id"
         assert token.content == "test"
 
     def test_agent_step_update(self):
         """Test AgentStepUpdate model."""
-        update = AgentStepUpdate(step_id="test-step-id", data={"thought": "partial"}, complete=False)
+        update = AgentStepUpdate.model_construct(step_id="test-step-id", data={"thought": "partial"}, complete=False)
         assert update.type == "step_update"
         assert update.step_id == "test-step-id"
         assert update.data == {"thought": "partial"}
         assert not update.complete
 
-    def test_streaming_event_types(self):
-        """Test that all streaming events have correct type."""
-        assert AgentStreamStart(step_id="step-1").type == "stream_start"
-        assert AgentStreamEnd(step_id="step-1").type == "stream_end"
-
-        plan_event = AgentPlanEvent(step_id="step-1", plan=AgentPlan(plan="step1"))
-        assert plan_event.type == "agent_plan"
-
-        step_event = AgentStepEvent(
-            step_id="step-1",
-            step=AgentStep(tool_thought="test", tool_calls=[ToolCall(id="1", tool_name="test")]),
-        )
-        assert step_event.type == "agent_step"
+    def test_streaming_models_validate_input(self):
+        """Test that validated streaming models match their model_construct counterparts."""
+        token = AgentToken(step_id="test-step-id", content="test")
+        update = AgentStepUpdate(step_id="test-step-id", data={"thought": "partial"}, complete=False)
+        assert token == AgentToken.model_construct(step_id="test-step-id", content="test")
+        assert update.type == "step_update"
+        assert update.data == {"thought": "partial"}
 
-        final_event = AgentFinalResponseEvent(step_id="step-1", response=AgentFinalResponse(final_answer="done"))
-        assert final_event.type == "final_response"
+    @pytest.mark.parametrize(("factory", "expected_type"), STREAMING_EVENTS, ids=[t for _, t in STREAMING_EVENTS])
+    def test_streaming_event_types(self, factory, expected_type):
+        """Test that each streaming event has the correct type."""
+        assert factory().type == expected_type
@@ -2,6 +2,8 @@
 Tests for the parser module.
 """
 
+import json
+
 from acton_agent.agent.models import (
     AgentFinalResponse,
     AgentPlan,
@@ -110,6 +112,23 @@ Some text after"""
         extracted = ResponseParser._extract_json_from_markdown(text)
         assert extracted == text
 
+    def test_extract_json_from_fixture_responses(
+        self,
+        tool_call_response,
+        tool_call_response_parsed,
+        final_answer_response,
+        final_answer_response_parsed,
+        plan_response,
+        plan_response_parsed,
+    ):
+        """Test that extraction recovers the JSON body of each canned LLM response."""
+        for response, parsed in [
+            (tool_call_response, tool_call_response_parsed),
+            (final_answer_response, final_answer_response_parsed),
+            (plan_response, plan_response_parsed),
+        ]:
+            assert json.loads(ResponseParser._extract_json_from_markdown(response)) == parsed
+
 
 class TestResponseValidation:
     """Tests for response validation."""
@@ -2,7 +2,9 @@
 Tests for the tools module.
 """
 
+import asyncio
 import json
+from enum import Enum
 
 import pytest
 from pydantic import Field
@@ -91,6 +93,22 @@ class TestToolRegistry:
         result = registry.get("nonexistent")
         assert result is None
 
+    def test_lookup_with_str_subclass_and_non_str_names(self):
+        """Test that str subclasses work as tool names and non-string lookups simply miss."""
+
+        class Names(str, Enum):
+            SIMPLE = "simple"
+
+        registry = ToolRegistry()
+        tool = SimpleTool()
+        tool.name = Names.SIMPLE
+        registry.register(tool)
+
+        assert registry.get("simple") is tool
+        assert registry.has_tool(Names.SIMPLE)
+        assert None not in registry
+        assert not registry.has_tool(1)
+
     def test_unregister_tool(self):
         """
         Ensure a registered tool can be removed from the registry. After unregistering, the tool is no longer present.
@@ -139,6 +157,33 @@ class TestToolRegistry:
         names = registry.list_tool_names()
         assert names == ["simple", "simple2"]
 
+    def test_iter_tools_and_names(self):
+        """Test that the iteration views reflect the registered tools."""
+        registry = ToolRegistry()
+        tool = SimpleTool()
+        registry.register(tool)
+
+        tools_view = registry.iter_tools()
+        names_view = registry.iter_tool_names()
+        assert list(tools_view) == [tool]
+        assert list(names_view) == ["simple"]
+
+        registry.unregister("simple")
+        assert list(tools_view) == []
+        assert "simple" not in names_view
+
+    def test_known_names(self):
+        """Test bulk membership checks for tool names."""
+        registry = ToolRegistry()
+        tool2 = SimpleTool()
+        tool2.name = "simple2"
+        registry.register(SimpleTool())
+        registry.register(tool2)
+
+        assert registry.known_names(["simple", "missing"]) == {"simple"}
+        assert registry.known_names(frozenset({"simple", "simple2"})) == {"simple", "simple2"}
+        assert registry.known_names(iter([])) == set()
+
     def test_format_for_prompt(self):
         """Test formatting tools for prompt."""
         registry = ToolRegistry()
@@ -149,6 +194,138 @@ class TestToolRegistry:
         assert "simple" in formatted
         assert "A simple test tool" in formatted
 
+    def test_format_for_prompt_is_cached(self):
+        """Test that the prompt text is reused while the registry is unchanged."""
+        registry = ToolRegistry()
+        registry.register(SimpleTool())
+
+        assert registry.format_for_prompt() is registry.format_for_prompt()
+
+    def test_format_for_prompt_cache_invalidated_on_mutation(self):
+        """Test that registering, unregistering, and clearing rebuild the prompt text."""
+        registry = ToolRegistry()
+        registry.register(SimpleTool())
+        first = registry.format_for_prompt()
+
+        tool2 = SimpleTool()
+        tool2.name = "simple2"
+        registry.register(tool2)
+        second = registry.format_for_prompt()
+        assert "simple2" not in first
+        assert "simple2" in second
+
+        registry.unregister("simple2")
+        assert "simple2" not in registry.format_for_prompt()
+
+        registry.clear()
+        assert registry.format_for_prompt() == "No tools available."
+
+    def test_iter_prompt_lines_matches_format_for_prompt(self):
+        """Test that the chunked prompt listing joins to the same text as format_for_prompt."""
+        registry = ToolRegistry()
+        assert "".join(registry.iter_prompt_lines()) == "No tools available."
+
+        registry.register(SimpleTool())
+        chunks = list(registry.iter_prompt_lines())
+        assert len(chunks) > 1
+        assert "".join(chunks) == registry.format_for_prompt()
+        assert list(registry.iter_prompt_lines()) == [registry.format_for_prompt()]
+
+    def test_schema_serialized_once_while_unchanged(self, monkeypatch):
+        """Test that a tool's schema is not re-serialized while get_schema() returns the same object."""
+        calls = []
+        original_serialize = ToolRegistry._serialize_schema
+
+        def counting_serialize(schema):
+            """
+            Record the call and delegate to the original serializer.
+
+            Returns:
+                str: The serialized schema.
+            """
+            calls.append(1)
+            return original_serialize(schema)
+
+        monkeypatch.setattr(ToolRegistry, "_serialize_schema", staticmethod(counting_serialize))
+
+        class GreetInput(ToolInputSchema):
+            name: str = Field(..., description="Name of person to greet")
+
+        registry = ToolRegistry()
+        tool = FunctionTool(name="greet", description="Greet someone", func=lambda name: name, input_schema=GreetInput)
+        registry.register(tool)
+
+        tool2 = FunctionTool(name="noop", description="Does nothing", func=lambda: "ok")
+        registry.format_for_prompt()
+        registry.register(tool2)
+        formatted = registry.format_for_prompt()
+
+        assert len(calls) == 2  # once per tool, at registration
+        assert json.dumps(tool.get_schema(), separators=(",", ":")) in formatted
+
+    def test_prompt_reflects_replaced_input_schema(self):
+        """Test that the prompt advertises a FunctionTool's new schema after input_schema is replaced."""
+
+        class OldInput(ToolInputSchema):
+            old_field: str = Field(..., description="Old field")
+
+        class NewInput(ToolInputSchema):
+            new_field: str = Field(..., description="New field")
+
+        registry = ToolRegistry()
+        tool = FunctionTool(name="swap", description="Swaps schema", func=lambda **kwargs: "ok", input_schema=OldInput)
+        registry.register(tool)
+        assert "old_field" in registry.format_for_prompt()
+
+        tool.input_schema = NewInput
+        registry.register(SimpleTool())  # any mutation rebuilds the cached listing
+        prompt = registry.format_for_prompt()
+
+        assert "new_field" in prompt
+        assert "old_field" not in prompt
+        assert "new_field" in registry.format_promoted_schemas(["swap"])
+
+    def test_format_summary_pool(self):
+        """Test that the summary pool lists one line per tool without schemas."""
+        registry = ToolRegistry()
+        tool = SimpleTool()
+        tool.description = "A simple test tool\nWith more detail"
+        registry.register(tool)
+
+        summary = registry.format_summary_pool()
+        assert summary == "simple: A simple test tool"
+
+    def test_format_summary_pool_is_cached(self):
+        """Test that the summary pool is reused until the registry changes."""
+        registry = ToolRegistry()
+        registry.register(SimpleTool())
+        first = registry.format_summary_pool()
+        assert registry.format_summary_pool() is first
+
+        tool2 = SimpleTool()
+        tool2.name = "simple2"
+        registry.register(tool2)
+        assert "simple2: A simple test tool" in registry.format_summary_pool()
+
+    def test_format_summary_pool_empty(self):
+        """Test the summary pool of an empty registry."""
+        assert ToolRegistry().format_summary_pool() == "No tools available."
+
+    def test_format_promoted_schemas(self):
+        """Test that only the selected tools get compact schemas."""
+        registry = ToolRegistry()
+        tool1 = SimpleTool()
+        tool2 = SimpleTool()
+        tool2.name = "simple2"
+        registry.register(tool1)
+        registry.register(tool2)
+
+        promoted = registry.format_promoted_schemas(["simple2", "unknown"])
+        assert "Tool: simple2" in promoted
+        assert "Tool: simple\n" not in promoted
+        assert json.dumps(tool2.get_schema(), separators=(",", ":")) in promoted
+        assert registry.format_promoted_schemas([]) == ""
+
     def test_clear_registry(self):
         """Test clearing all tools."""
         registry = ToolRegistry()
@@ -218,6 +395,45 @@ class TestFunctionTool:
         result = tool.execute({"name": "Alice"})
         assert result == "Hello, Alice!"
 
+    def test_function_tool_with_async_function(self):
+        """Test that FunctionTool awaits coroutine functions."""
+
+        async def fetch(key: str) -> dict:
+            await asyncio.sleep(0)
+            return {"key": key}
+
+        tool = FunctionTool(name="fetch", description="Fetch a key", func=fetch)
+
+        assert json.loads(tool.execute({"key": "a"})) == {"key": "a"}
+
+    def test_function_tool_with_async_function_inside_running_loop(self):
+        """Test that an async FunctionTool can be executed from code already running an event loop."""
+
+        async def fetch(key: str) -> dict:
+            await asyncio.sleep(0)
+            return {"key": key}
+
+        tool = FunctionTool(name="fetch", description="Fetch a key", func=fetch)
+
+        async def handler() -> str:
+            return tool.execute({"key": "a"})
+
+        assert json.loads(asyncio.run(handler())) == {"key": "a"}
+
+    def test_function_tool_async_error_inside_running_loop(self):
+        """Test that errors from an async function propagate when executed inside a running loop."""
+
+        async def fail() -> str:
+            raise RuntimeError("boom")
+
+        tool = FunctionTool(name="fail", description="Always fails", func=fail)
+
+        async def handler() -> str:
+            return tool.execute({})
+
+        with pytest.raises(RuntimeError, match="boom"):
+            asyncio.run(handler())
+
     def test_function_tool_with_dict_return(self):
         """Test function tool that returns a dict."""
 
@@ -424,6 +640,27 @@ class TestFunctionToolConfiguration:
         assert "properties" in schema
         assert "name" in schema["properties"]
 
+    def test_function_tool_schema_generated_once(self):
+        """Test that FunctionTool reuses its generated schema until input_schema is replaced."""
+
+        class GreetInput(ToolInputSchema):
+            name: str = Field(..., description="Name of person to greet")
+
+        class FarewellInput(ToolInputSchema):
+            person: str = Field(..., description="Name of person to bid farewell")
+
+        tool = FunctionTool(
+            name="greet",
+            description="Greet someone",
+            func=lambda name: f"Hello, {name}!",
+            input_schema=GreetInput,
+        )
+
+        assert tool.get_schema() is tool.get_schema()
+
+        tool.input_schema = FarewellInput
+        assert "person" in tool.get_schema()["properties"]
+
     def test_function_tool_input_validation_success(self):
         """Test that FunctionTool validates input parameters successfully."""
 
@@ -220,6 +220,63 @@ def test_overwrite_toolset(sample_toolset, sample_tools):
     assert "Updated toolset" in prompt
 
 
+def test_overwritten_toolset_tools_become_standalone(sample_toolset, sample_tools):
+    """Test that tools left behind by an overwritten toolset are listed as standalone tools."""
+    registry = ToolRegistry()
+    registry.register_toolset(sample_toolset)
+
+    new_toolset = ToolSet(
+        name="test_toolset",
+        description="Updated toolset",
+        tools=[FunctionTool(name="new_tool", description="New tool", func=lambda: "new")],
+    )
+    registry.register_toolset(new_toolset)
+
+    prompt = registry.format_for_prompt()
+    standalone_section = prompt.split("--- Standalone Tools ---")[1]
+    for tool in sample_tools:
+        assert f"Tool: {tool.name}" in standalone_section
+    assert "Tool: new_tool" not in standalone_section
+
+
+def test_overwritten_toolset_config_not_applied_to_old_tools(sample_toolset, sample_tools):
+    """Test that a replaced toolset's config no longer applies to the tools it left behind."""
+    registry = ToolRegistry()
+    registry.register_toolset(sample_toolset)
+    registry.register_toolset(ToolSet(name="test_toolset", description="Updated toolset", tools=[]))
+
+    for tool in sample_tools:
+        assert registry.get_toolset_config(tool.name) is None
+
+
+def test_shared_tool_keeps_toolset_config_per_registry(sample_tools):
+    """Test that registries sharing a tool object keep their own toolset association."""
+
+    class KeyConfig(ConfigSchema):
+        k: int = Field(..., description="Key")
+
+    shared = sample_tools[0]
+    first = ToolSet(name="w", description="First", tools=[shared], config_schema=KeyConfig)
+    second = ToolSet(name="v", description="Second", tools=[shared], config_schema=KeyConfig)
+    first.update_config({"k": 1})
+    second.update_config({"k": 2})
+
+    registry_a = ToolRegistry()
+    registry_b = ToolRegistry()
+    registry_a.register_toolset(first)
+    registry_b.register_toolset(second)
+
+    assert registry_a.get_toolset_config(shared.name) == {"k": 1}
+    assert registry_b.get_toolset_config(shared.name) == {"k": 2}
+
+    registry_b.clear()
+    assert registry_a.get_toolset_config(shared.name) == {"k": 1}
+
+    registry_b.register_toolset(second)
+    registry_b.unregister_toolset("v")
+    assert registry_a.get_toolset_config(shared.name) == {"k": 1}
+
+
 def test_empty_toolset():
     """Test creating an empty toolset."""
     empty_toolset = ToolSet(